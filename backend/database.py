@@ -1,15 +1,68 @@
+import sqlite3
 from pathlib import Path
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool
 
 from backend.models import Base
 
+# ── SQLite connection PRAGMAs ────────────────────────────────────────
+# Applied on every new DBAPI connection.  The read PRAGMAs enlarge the
+# per-connection page cache and memory-map the file; the write PRAGMAs
+# only make sense for the read-write app database.
+_READ_PRAGMAS = (
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",        # 64 MB page cache
+    "PRAGMA mmap_size=30000000000",
+    "PRAGMA busy_timeout=5000",
+)
+
+_WRITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+)
+
+
+def _register_pragmas(target_engine, pragmas: tuple[str, ...]) -> None:
+    @event.listens_for(target_engine, "connect")
+    def _set_pragmas(dbapi_conn, _record):
+        cur = dbapi_conn.cursor()
+        for pragma in pragmas:
+            cur.execute(pragma)
+        cur.close()
+
+
+def _register_optimize_on_close(target_engine) -> None:
+    # Lets SQLite refresh planner statistics as connections are retired.
+    @event.listens_for(target_engine, "close")
+    def _optimize(dbapi_conn, _record):
+        try:
+            dbapi_conn.execute("PRAGMA optimize")
+        except sqlite3.Error:
+            pass  # Never block a close on housekeeping
+
+
+# Keep warm connections (and their page caches) around between requests.
+# Local SQLite files never go stale, so pre-ping / recycling is skipped.
+_POOL_ARGS = {
+    "poolclass": QueuePool,
+    "pool_size": 8,
+    "max_overflow": 16,
+    "pool_pre_ping": False,
+    "pool_recycle": -1,
+}
+
+
 # ── App database (read-write) ────────────────────────────────────────
 engine = create_engine(
     "sqlite:///./app.db",
     connect_args={"check_same_thread": False},
+    **_POOL_ARGS,
 )
+_register_pragmas(engine, _WRITE_PRAGMAS + _READ_PRAGMAS)
+_register_optimize_on_close(engine)
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
@@ -24,11 +77,16 @@ def get_db():
 # ── Wellstar database (read-only) ────────────────────────────────────
 WELLSTAR_DB_PATH = Path(__file__).parent / "db" / "Wellstar.db"
 
+# Opened read-only + immutable so SQLite skips file locking entirely.
+# Index maintenance (init_db.py) uses its own writable connection.
 wellstar_engine = create_engine(
-    f"sqlite:///{WELLSTAR_DB_PATH}",
+    f"sqlite:///file:{WELLSTAR_DB_PATH}?mode=ro&immutable=1&uri=true",
     connect_args={"check_same_thread": False},
     echo=False,
+    **_POOL_ARGS,
 )
+_register_pragmas(wellstar_engine, _READ_PRAGMAS)
+_register_optimize_on_close(wellstar_engine)
 
 WellstarSession = sessionmaker(
     autocommit=False, autoflush=False, bind=wellstar_engine
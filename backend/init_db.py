@@ -3,7 +3,9 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-from backend.database import engine, wellstar_engine
+from sqlalchemy import create_engine
+
+from backend.database import WELLSTAR_DB_PATH, engine
 from backend.models import Base
 
 
@@ -13,14 +15,20 @@ def create_wellstar_indexes():
         "CREATE INDEX IF NOT EXISTS idx_equipment_job_date ON Equipment(Job, ReportDate);",
         "CREATE INDEX IF NOT EXISTS idx_sample_job_date ON Sample(Job, ReportDate);",
         "CREATE INDEX IF NOT EXISTS idx_concentaddloss_job_date ON ConcentAddLoss(Job, ReportDate);",
-        "CREATE INDEX IF NOT EXISTS idx_report_job_date ON Report(Job, ReportDate);",
+        "CREATE INDEX IF NOT EXISTS idx_concentaddloss_job_item_date ON ConcentAddLoss(Job, ItemName, ReportDate);",
+        # Covering index: also serves (Job, ReportDate) lookups, and the job
+        # summary's MDDepth/TVDDepth/Engineer projection never touches the table
+        "CREATE INDEX IF NOT EXISTS idx_report_job_cover ON Report(Job, ReportDate, MDDepth, TVDDepth, Engineer);",
         "CREATE INDEX IF NOT EXISTS idx_circdata_job_date ON CircData(Job, ReportDate);",
         "CREATE INDEX IF NOT EXISTS idx_sample_time ON Sample(Job, ReportDate, SampleTime);",
     ]
-    with wellstar_engine.connect() as conn:
+    # The app's wellstar_engine is read-only; index creation needs a writer.
+    writable = create_engine(f"sqlite:///{WELLSTAR_DB_PATH}")
+    with writable.connect() as conn:
         for sql in indexes:
             conn.execute(__import__("sqlalchemy").text(sql))
         conn.commit()
+    writable.dispose()
     print("Wellstar.db indexes created.")
 
 
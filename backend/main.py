@@ -1,14 +1,42 @@
+import asyncio
+import logging
 import sys
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from backend.routers import api_router
 
-app = FastAPI(title="Mud Reports API")
+logger = logging.getLogger(__name__)
+
+
+def _warm_pdf_renderer() -> None:
+    from backend.services.pdf_generator import warm_up
+    warm_up()
+
+
+def _log_warm_up_failure(future: asyncio.Future) -> None:
+    # Not fatal: the first PDF request imports reportlab itself
+    if not future.cancelled() and future.exception() is not None:
+        logger.error("PDF renderer warm-up failed", exc_info=future.exception())
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # reportlab is imported lazily (~0.2-0.4 s); load it in the background so
+    # neither startup nor the first PDF report request waits on it
+    app.state.pdf_warm_up = asyncio.get_running_loop().run_in_executor(None, _warm_pdf_renderer)
+    app.state.pdf_warm_up.add_done_callback(_log_warm_up_failure)
+    yield
+
+
+# orjson serialises the large event / timeline / insights payloads far faster
+app = FastAPI(title="Mud Reports API", default_response_class=ORJSONResponse, lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
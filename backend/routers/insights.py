@@ -2,9 +2,16 @@
 
 from __future__ import annotations
 
+import threading
+import time
+from bisect import bisect_left, bisect_right
+from typing import Any, NamedTuple
+
 from fastapi import APIRouter, Depends, Query
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import Response
-from sqlalchemy import func, text
+from pydantic import TypeAdapter
+from sqlalchemy import Row, func, select, text
 from sqlalchemy.orm import Session
 
 from backend.database import get_wellstar_db
@@ -14,16 +21,211 @@ from backend.models_wellstar import (
     Report,
     Sample,
 )
-from backend.services.chemical_categorizer import categorize, categorize_batch
-from backend.services.timeline import get_timeline, get_previous_day
+from backend.services.chemical_categorizer import categorize_batch
+from backend.services.timeline import get_timeline
 from backend.services.event_detector import detect_all_events
 from backend.services.causal_linker import link_events
 from backend.services.narrative_generator import generate_insights
-from backend.services.pdf_generator import generate_pdf
-from backend.schemas_insights import EventSeverity
+from backend.schemas_insights import CausalLink, Event, EventSeverity
 
 router = APIRouter()
 
+# Serialise whole event / link lists in one pydantic-core pass
+_EVENTS_ADAPTER = TypeAdapter(list[Event])
+_LINKS_ADAPTER = TypeAdapter(list[CausalLink])
+
+
+# ── Per-job artifact cache ───────────────────────────────────────────────────
+#
+# The events, insights and report endpoints all need the full timeline plus
+# the detected events and causal links.  Build those once per job (along with
+# per-date / per-event lookup indexes) and reuse them for a short while; the
+# Report row count / max ID acts as a cheap version stamp so new data for the
+# job is picked up on the next request.
+
+class _JobArtifacts(NamedTuple):
+    timeline: list[dict[str, Any]]
+    events: list[Event]
+    event_dates: list[str]  # `events[i].date`, sorted — bisect for date ranges
+    links: list[CausalLink]
+    events_by_date: dict[str, list[Event]]
+    links_by_event: dict[str, list[int]]  # event ID → positions in `links`
+    day_index: dict[str, int]  # ISO date → position in `timeline`
+
+
+_ARTIFACT_TTL_SECONDS = 30.0
+_ARTIFACT_CACHE_SIZE = 64
+_artifact_cache: dict[tuple, tuple[float, _JobArtifacts]] = {}
+# Handlers run on threadpool workers: `_artifact_lock` guards every read /
+# write of `_artifact_cache` and `_artifact_build_locks`; the per-job build
+# lock stops concurrent misses for one job from building it twice.
+_artifact_lock = threading.Lock()
+_artifact_build_locks: dict[str, threading.Lock] = {}
+
+
+def _index_artifacts(
+    events: list[Event], links: list[CausalLink],
+) -> tuple[dict[str, list[Event]], dict[str, list[int]]]:
+    """Group events by date and map each event ID to the links touching it."""
+    events_by_date: dict[str, list[Event]] = {}
+    for e in events:
+        events_by_date.setdefault(e.date, []).append(e)
+
+    links_by_event: dict[str, list[int]] = {}
+    for i, cl in enumerate(links):
+        links_by_event.setdefault(cl.cause_event_id, []).append(i)
+        if cl.effect_event_id != cl.cause_event_id:
+            links_by_event.setdefault(cl.effect_event_id, []).append(i)
+    return events_by_date, links_by_event
+
+
+def _get_job_artifacts(db: Session, job_id: str) -> _JobArtifacts:
+    """Return the timeline, events, causal links and indexes for *job_id*, cached."""
+    version = (
+        db.query(func.count(Report.ID), func.max(Report.ID))
+        .filter(Report.Job == job_id)
+        .one()
+    )
+    key = (job_id, tuple(version))
+
+    artifacts = _cached_artifacts(key)
+    if artifacts is not None:
+        return artifacts
+
+    with _artifact_lock:
+        build_lock = _artifact_build_locks.setdefault(job_id, threading.Lock())
+    with build_lock:
+        # Another request may have built it while we waited
+        artifacts = _cached_artifacts(key)
+        if artifacts is not None:
+            return artifacts
+        try:
+            artifacts = _build_job_artifacts(db, job_id)
+            _store_artifacts(key, artifacts)
+        finally:
+            with _artifact_lock:
+                if _artifact_build_locks.get(job_id) is build_lock:
+                    del _artifact_build_locks[job_id]
+    return artifacts
+
+
+def _cached_artifacts(key: tuple) -> _JobArtifacts | None:
+    with _artifact_lock:
+        cached = _artifact_cache.get(key)
+    if cached is not None and time.monotonic() - cached[0] < _ARTIFACT_TTL_SECONDS:
+        return cached[1]
+    return None
+
+
+def _store_artifacts(key: tuple, artifacts: _JobArtifacts) -> None:
+    with _artifact_lock:
+        _artifact_cache.pop(key, None)
+        while len(_artifact_cache) >= _ARTIFACT_CACHE_SIZE:
+            _artifact_cache.pop(next(iter(_artifact_cache)))
+        _artifact_cache[key] = (time.monotonic(), artifacts)
+
+
+def _build_job_artifacts(db: Session, job_id: str) -> _JobArtifacts:
+    # Detectors need the complete history for rolling averages
+    timeline = get_timeline(db, job_id)
+    events = detect_all_events(timeline, job_id)
+    links = link_events(events)
+    return _JobArtifacts(
+        timeline, events, [e.date for e in events], links,
+        *_index_artifacts(events, links),
+        {day["date"]: i for i, day in enumerate(timeline)},
+    )
+
+
+def _target_and_previous_day(
+    artifacts: _JobArtifacts, job_id: str, date: str,
+) -> tuple[dict[str, Any], dict[str, Any] | None]:
+    """Timeline entry for *date* and the entry before it (404 if *date* is absent)."""
+    i = artifacts.day_index.get(date)
+    if i is None:
+        from fastapi import HTTPException
+        raise HTTPException(status_code=404, detail=f"No data for date '{date}' in job '{job_id}'")
+    timeline = artifacts.timeline
+    return timeline[i], timeline[i - 1] if i > 0 else None
+
+
+# ── Rendered PDF cache ───────────────────────────────────────────────────────
+#
+# A report is fully determined by the job artifacts, date and shift, so the
+# rendered PDF is kept alongside the artifacts object it was built from.  An
+# entry is only reused while `_get_job_artifacts` still returns that same
+# object, i.e. it expires with the artifact TTL / version stamp.
+
+_PDF_CACHE_SIZE = 64
+_pdf_cache: dict[tuple[str, str, str], tuple[_JobArtifacts, bytes]] = {}
+_pdf_lock = threading.Lock()  # guards `_pdf_cache` (see `_artifact_lock`)
+
+
+def _cached_pdf(artifacts: _JobArtifacts, key: tuple[str, str, str]) -> bytes | None:
+    with _pdf_lock:
+        cached = _pdf_cache.get(key)
+    if cached is not None and cached[0] is artifacts:
+        return cached[1]
+    return None
+
+
+def _store_pdf(artifacts: _JobArtifacts, key: tuple[str, str, str], pdf: bytes) -> None:
+    with _pdf_lock:
+        _pdf_cache.pop(key, None)
+        while len(_pdf_cache) >= _PDF_CACHE_SIZE:
+            _pdf_cache.pop(next(iter(_pdf_cache)))
+        _pdf_cache[key] = (artifacts, pdf)
+
+
+def _pdf_response(pdf: bytes, filename: str) -> Response:
+    return Response(
+        content=pdf,
+        media_type="application/pdf",
+        headers={"Content-Disposition": f'inline; filename="{filename}"'},
+    )
+
+
+def _day_events_and_links(
+    artifacts: _JobArtifacts, date: str,
+) -> tuple[list[Event], list[CausalLink]]:
+    """Events on *date* plus every causal link touching them (original link order)."""
+    day_events = artifacts.events_by_date.get(date, [])
+    positions = sorted({
+        i for e in day_events for i in artifacts.links_by_event.get(e.id, ())
+    })
+    return day_events, [artifacts.links[i] for i in positions]
+
+
+# ── ReportDate values only Python can read ───────────────────────────────────
+#
+# `report_date_iso` yields NULL for the rare dates only `parse_report_date`
+# accepts (Unicode whitespace / digits).  Endpoints that aggregate dates in SQL
+# fetch those rows separately and fold them in, so their results match the
+# Python parser (and `get_timeline`, which keeps such rows).
+
+def _python_only_report_dates(db: Session, model, *columns, where=()) -> list[tuple[Row, str]]:
+    """(row, ISO date) for rows whose ReportDate SQL cannot parse but Python can."""
+    from backend.services.timeline import parse_report_date, report_date_iso
+
+    stmt = select(*columns, model.ReportDate).where(
+        *where,
+        model.ReportDate.isnot(None),
+        report_date_iso(model.ReportDate).is_(None),
+    )
+    return [
+        (row, d.isoformat())
+        for row in db.execute(stmt)
+        if (d := parse_report_date(row.ReportDate)) is not None
+    ]
+
+
+def _merged_span(
+    first: str | None, last: str | None, extra: list[str],
+) -> tuple[str | None, str | None]:
+    """Widen a SQL MIN/MAX date span with Python-parsed ISO dates."""
+    dates = [d for d in (first, last, *extra) if d is not None]
+    return (min(dates), max(dates)) if dates else (None, None)
+
 
 # ── GET /api/insights/jobs ───────────────────────────────────────────────────
 
@@ -33,8 +235,7 @@ def list_jobs(
     db: Session = Depends(get_wellstar_db),
 ):
     """List all jobs with basic stats. Filtered to jobs with >= min_reports reports."""
-    from backend.services.timeline import parse_report_date
-    from sqlalchemy.orm import aliased
+    from backend.services.timeline import report_date_iso
 
     # Build subqueries for sample and chemical counts
     sample_counts = (
@@ -60,8 +261,8 @@ def list_jobs(
         db.query(
             Report.Job,
             func.count(Report.ID).label("report_count"),
-            func.min(Report.ReportDate).label("first_date_raw"),
-            func.max(Report.ReportDate).label("last_date_raw"),
+            func.min(report_date_iso(Report.ReportDate)).label("first_date"),
+            func.max(report_date_iso(Report.ReportDate)).label("last_date"),
             func.coalesce(sample_counts.c.cnt, 0).label("sample_count"),
             func.coalesce(chem_counts.c.cnt, 0).label("chemical_txn_count"),
         )
@@ -73,14 +274,19 @@ def list_jobs(
         .all()
     )
 
+    python_dates: dict[str, list[str]] = {}
+    for row, iso in _python_only_report_dates(db, Report, Report.Job):
+        python_dates.setdefault(row.Job, []).append(iso)
+
     jobs = []
     for row in rows:
-        first_date = parse_report_date(row.first_date_raw)
-        last_date = parse_report_date(row.last_date_raw)
+        first_date, last_date = _merged_span(
+            row.first_date, row.last_date, python_dates.get(row.Job, []),
+        )
         jobs.append({
             "job_id": row.Job,
-            "first_date": first_date.isoformat() if first_date else row.first_date_raw,
-            "last_date": last_date.isoformat() if last_date else row.last_date_raw,
+            "first_date": first_date,
+            "last_date": last_date,
             "report_count": row.report_count,
             "sample_count": row.sample_count,
             "chemical_txn_count": row.chemical_txn_count,
@@ -94,49 +300,67 @@ def list_jobs(
 @router.get("/jobs/{job_id}/summary")
 def get_job_summary(job_id: str, db: Session = Depends(get_wellstar_db)):
     """Return aggregate stats for a single job."""
-    from backend.services.timeline import parse_report_date
+    from backend.services.timeline import report_date_iso
 
     # Report stats
-    reports = db.query(Report).filter(Report.Job == job_id).all()
+    reports = (
+        db.query(Report.MDDepth, Report.TVDDepth, Report.Engineer)
+        .filter(Report.Job == job_id)
+        .all()
+    )
     if not reports:
         from fastapi import HTTPException
         raise HTTPException(status_code=404, detail=f"Job '{job_id}' not found")
 
-    dates = [parse_report_date(r.ReportDate) for r in reports]
-    dates = sorted([d for d in dates if d is not None])
-
     max_md = max((r.MDDepth for r in reports if r.MDDepth is not None), default=None)
     max_tvd = max((r.TVDDepth for r in reports if r.TVDDepth is not None), default=None)
 
     engineers = list({r.Engineer for r in reports if r.Engineer})
     engineers.sort()
 
-    # Sample count
-    sample_count = (
-        db.query(func.count(Sample.ID))
-        .filter(Sample.Job == job_id)
-        .scalar()
-    ) or 0
-
-    # Equipment day count
-    equipment_count = (
-        db.query(func.count(Equipment.ID))
-        .filter(Equipment.Job == job_id)
-        .scalar()
-    ) or 0
-
-    # Chemical stats
-    chemical_txn_count = (
-        db.query(func.count(ConcentAddLoss.ID))
-        .filter(ConcentAddLoss.Job == job_id)
-        .scalar()
-    ) or 0
-
-    unique_chemicals = (
-        db.query(func.count(func.distinct(ConcentAddLoss.ItemName)))
-        .filter(ConcentAddLoss.Job == job_id)
-        .scalar()
-    ) or 0
+    # Report date span + sample / equipment / chemical counts — one round-trip
+    report_date = report_date_iso(Report.ReportDate)
+    counts = db.query(
+        select(func.min(report_date))
+        .where(Report.Job == job_id)
+        .scalar_subquery()
+        .label("first_date"),
+        select(func.max(report_date))
+        .where(Report.Job == job_id)
+        .scalar_subquery()
+        .label("last_date"),
+        select(func.count(report_date))
+        .where(Report.Job == job_id)
+        .scalar_subquery()
+        .label("total_days"),
+        select(func.count(Sample.ID))
+        .where(Sample.Job == job_id)
+        .scalar_subquery()
+        .label("sample_count"),
+        select(func.count(Equipment.ID))
+        .where(Equipment.Job == job_id)
+        .scalar_subquery()
+        .label("equipment_count"),
+        select(func.count(ConcentAddLoss.ID))
+        .where(ConcentAddLoss.Job == job_id)
+        .scalar_subquery()
+        .label("chemical_txn_count"),
+        select(func.count(func.distinct(ConcentAddLoss.ItemName)))
+        .where(ConcentAddLoss.Job == job_id)
+        .scalar_subquery()
+        .label("unique_chemicals"),
+    ).one()
+    sample_count = counts.sample_count or 0
+    equipment_count = counts.equipment_count or 0
+    chemical_txn_count = counts.chemical_txn_count or 0
+    unique_chemicals = counts.unique_chemicals or 0
+
+    # Report dates only the Python parser reads are missing from the SQL span
+    python_dates = [
+        iso for _, iso in _python_only_report_dates(db, Report, where=(Report.Job == job_id,))
+    ]
+    first_date, last_date = _merged_span(counts.first_date, counts.last_date, python_dates)
+    total_days = (counts.total_days or 0) + len(python_dates)
 
     # Mud type from CircData
     from backend.models_wellstar import CircData
@@ -148,9 +372,9 @@ def get_job_summary(job_id: str, db: Session = Depends(get_wellstar_db)):
 
     return {
         "job_id": job_id,
-        "first_date": dates[0].isoformat() if dates else None,
-        "last_date": dates[-1].isoformat() if dates else None,
-        "total_days": len(dates),
+        "first_date": first_date,
+        "last_date": last_date,
+        "total_days": total_days,
         "max_depth_md": max_md,
         "max_depth_tvd": max_tvd,
         "mud_type": mud_type_row[0] if mud_type_row else None,
@@ -165,21 +389,21 @@ def get_job_summary(job_id: str, db: Session = Depends(get_wellstar_db)):
 # ── GET /api/insights/jobs/{job_id}/timeline ─────────────────────────────────
 
 @router.get("/jobs/{job_id}/timeline")
-def get_job_timeline(
+async def get_job_timeline(
     job_id: str,
     start: str | None = Query(None, description="Start date (ISO, inclusive)"),
     end: str | None = Query(None, description="End date (ISO, inclusive)"),
     db: Session = Depends(get_wellstar_db),
 ):
     """Return daily timeline data for a job."""
-    timeline = get_timeline(db, job_id, start_date=start, end_date=end)
+    timeline = await run_in_threadpool(get_timeline, db, job_id, start_date=start, end_date=end)
     return {"job_id": job_id, "days": len(timeline), "timeline": timeline}
 
 
 # ── GET /api/insights/jobs/{job_id}/events ────────────────────────────────────
 
 @router.get("/jobs/{job_id}/events")
-def get_job_events(
+async def get_job_events(
     job_id: str,
     start: str | None = Query(None, description="Start date (ISO, inclusive)"),
     end: str | None = Query(None, description="End date (ISO, inclusive)"),
@@ -187,43 +411,35 @@ def get_job_events(
     db: Session = Depends(get_wellstar_db),
 ):
     """Detect and return events for a job with causal links."""
-    # Get full timeline (detectors need complete history for rolling avgs)
-    timeline = get_timeline(db, job_id)
-
-    # Run all 18 detectors
-    events = detect_all_events(timeline, job_id)
-
-    # Apply causal linking
-    causal_links = link_events(events)
+    # Full-history detection + causal linking (cached per job)
+    artifacts = await run_in_threadpool(_get_job_artifacts, db, job_id)
+    events, causal_links = artifacts.events, artifacts.links
 
     # Apply filters on the output (after detection uses full history)
-    if start:
-        events = [e for e in events if e.date >= start]
-        causal_links = [
-            cl for cl in causal_links
-            if any(e.id in (cl.cause_event_id, cl.effect_event_id) for e in events)
-        ]
-    if end:
-        events = [e for e in events if e.date <= end]
-        causal_links = [
-            cl for cl in causal_links
-            if any(e.id in (cl.cause_event_id, cl.effect_event_id) for e in events)
-        ]
+    sev = None
     if severity:
         try:
             sev = EventSeverity(severity.lower())
-            events = [e for e in events if e.severity == sev]
-            event_ids = {e.id for e in events}
-            causal_links = [
-                cl for cl in causal_links
-                if cl.cause_event_id in event_ids or cl.effect_event_id in event_ids
-            ]
         except ValueError:
             pass  # Invalid severity value — ignore filter
 
+    if start or end or sev:
+        # Events come back date-sorted, so the range is a slice
+        lo = bisect_left(artifacts.event_dates, start) if start else 0
+        hi = bisect_right(artifacts.event_dates, end) if end else len(events)
+        events = events[lo:hi]
+        if sev is not None:
+            events = [e for e in events if e.severity == sev]
+        # Keep links that touch at least one surviving event
+        event_ids = {e.id for e in events}
+        causal_links = [
+            cl for cl in causal_links
+            if cl.cause_event_id in event_ids or cl.effect_event_id in event_ids
+        ]
+
     return {
-        "events": [e.model_dump() for e in events],
-        "causal_links": [cl.model_dump() for cl in causal_links],
+        "events": _EVENTS_ADAPTER.dump_python(events),
+        "causal_links": _LINKS_ADAPTER.dump_python(causal_links),
         "total": len(events),
         "filters": {"start": start, "end": end, "severity": severity},
     }
@@ -237,38 +453,58 @@ def get_new_chemicals(
     db: Session = Depends(get_wellstar_db),
 ):
     """Return first-appearance date for each unique chemical in the job."""
-    from backend.services.timeline import parse_report_date
-
-    # Query all chemical transactions for this job, ordered by date
-    rows = (
-        db.query(ConcentAddLoss)
-        .filter(ConcentAddLoss.Job == job_id)
-        .all()
+    from backend.services.timeline import report_date_iso
+
+    # Rank each item's transactions by (date, ID) and keep the first one.
+    first_date = report_date_iso(ConcentAddLoss.ReportDate)
+    ranked = (
+        select(
+            ConcentAddLoss.ID,
+            ConcentAddLoss.ItemName,
+            ConcentAddLoss.Quantity,
+            ConcentAddLoss.RepUnits,
+            first_date.label("first_date"),
+            func.row_number()
+            .over(partition_by=ConcentAddLoss.ItemName, order_by=(first_date, ConcentAddLoss.ID))
+            .label("rn"),
+        )
+        .where(
+            ConcentAddLoss.Job == job_id,
+            ConcentAddLoss.ItemName.isnot(None),
+            ConcentAddLoss.ItemName != "",
+            first_date.isnot(None),
+        )
+        .subquery()
     )
+    rows = db.query(ranked).filter(ranked.c.rn == 1).all()
 
-    # Find first appearance of each ItemName
-    first_seen: dict[str, dict] = {}
-    for row in rows:
-        item = row.ItemName
-        if not item:
-            continue
-        d = parse_report_date(row.ReportDate)
-        if d is None:
-            continue
-        if item not in first_seen or d < first_seen[item]["_date"]:
-            first_seen[item] = {
-                "_date": d,
-                "item_name": item,
-                "category": categorize(item),
-                "first_date": d.isoformat(),
-                "first_quantity": row.Quantity,
-                "units": row.RepUnits,
-            }
-
-    chemicals = sorted(first_seen.values(), key=lambda x: x["first_date"])
-    # Remove internal _date key
-    for c in chemicals:
-        c.pop("_date", None)
+    # item → (first date, ID, quantity, units); rows with dates only the
+    # Python parser reads compete for first appearance too
+    first_seen = {
+        row.ItemName: (row.first_date, row.ID, row.Quantity, row.RepUnits)
+        for row in rows
+    }
+    for row, iso in _python_only_report_dates(
+        db, ConcentAddLoss,
+        ConcentAddLoss.ID, ConcentAddLoss.ItemName, ConcentAddLoss.Quantity, ConcentAddLoss.RepUnits,
+        where=(ConcentAddLoss.Job == job_id, ConcentAddLoss.ItemName.isnot(None), ConcentAddLoss.ItemName != ""),
+    ):
+        seen = first_seen.get(row.ItemName)
+        if seen is None or (iso, row.ID) < seen[:2]:
+            first_seen[row.ItemName] = (iso, row.ID, row.Quantity, row.RepUnits)
+    ordered = sorted(first_seen.items(), key=lambda item: item[1][:2])
+
+    categories = categorize_batch([name for name, _ in ordered])
+    chemicals = [
+        {
+            "item_name": name,
+            "category": categories[name],
+            "first_date": first_date,
+            "first_quantity": quantity,
+            "units": units,
+        }
+        for name, (first_date, _, quantity, units) in ordered
+    ]
 
     return {
         "job_id": job_id,
@@ -280,54 +516,36 @@ def get_new_chemicals(
 # ── GET /api/insights/jobs/{job_id}/insights/{date} ──────────────────────────
 
 @router.get("/jobs/{job_id}/insights/{date}")
-def get_job_insights(
+async def get_job_insights(
     job_id: str,
     date: str,
     db: Session = Depends(get_wellstar_db),
 ):
     """Return plain-English insights + recommendations for a specific date."""
     # Full timeline needed for event detection rolling windows
-    timeline = get_timeline(db, job_id)
+    artifacts = await run_in_threadpool(_get_job_artifacts, db, job_id)
+    timeline = artifacts.timeline
 
     if not timeline:
         from fastapi import HTTPException
         raise HTTPException(status_code=404, detail=f"No timeline data for job '{job_id}'")
 
-    # Find the target day and previous day
-    target_day = None
-    for day in timeline:
-        if day["date"] == date:
-            target_day = day
-            break
-
-    if target_day is None:
-        from fastapi import HTTPException
-        raise HTTPException(status_code=404, detail=f"No data for date '{date}' in job '{job_id}'")
-
-    prev_day = get_previous_day(timeline, date)
-
-    # Run event detection and causal linking on full history
-    all_events = detect_all_events(timeline, job_id)
-    all_links = link_events(all_events)
+    target_day, prev_day = _target_and_previous_day(artifacts, job_id, date)
 
-    # Filter events to the target date
-    day_events = [e for e in all_events if e.date == date]
-    # Keep causal links that touch our day's events
-    day_event_ids = {e.id for e in day_events}
-    day_links = [
-        cl for cl in all_links
-        if cl.cause_event_id in day_event_ids or cl.effect_event_id in day_event_ids
-    ]
+    # Events on the target date + causal links that touch them
+    day_events, day_links = _day_events_and_links(artifacts, date)
 
     # Generate narratives
-    result = generate_insights(date, day_events, day_links, target_day, prev_day)
+    result = await run_in_threadpool(
+        generate_insights, date, day_events, day_links, target_day, prev_day,
+    )
     return result
 
 
 # ── GET /api/insights/jobs/{job_id}/report/{date} ─────────────────────────────
 
 @router.get("/jobs/{job_id}/report/{date}")
-def get_job_report(
+async def get_job_report(
     job_id: str,
     date: str,
     format: str = Query("json", description="Output format: json or pdf"),
@@ -335,42 +553,43 @@ def get_job_report(
     db: Session = Depends(get_wellstar_db),
 ):
     """Generate a shift handover report in JSON or PDF format."""
-    # Validate shift
+    # Validate query params up front — no point building the timeline otherwise
     if shift not in ("day", "evening", "night"):
-        shift = "day"
+        from fastapi import HTTPException
+        raise HTTPException(status_code=400, detail=f"Invalid shift '{shift}' (expected day, evening or night)")
+    if format.lower() not in ("json", "pdf"):
+        from fastapi import HTTPException
+        raise HTTPException(status_code=400, detail=f"Invalid format '{format}' (expected json or pdf)")
 
-    # Full timeline
-    timeline = get_timeline(db, job_id)
+    # Full timeline + events
+    artifacts = await run_in_threadpool(_get_job_artifacts, db, job_id)
+    timeline = artifacts.timeline
+
+    want_pdf = format.lower() == "pdf"
+    pdf_key = (job_id, date, shift)
+    filename = f"shift_report_{job_id}_{date}_{shift}.pdf"
+    if want_pdf:
+        pdf = _cached_pdf(artifacts, pdf_key)
+        if pdf is not None:
+            return _pdf_response(pdf, filename)
 
     if not timeline:
         from fastapi import HTTPException
         raise HTTPException(status_code=404, detail=f"No timeline data for job '{job_id}'")
 
-    target_day = None
-    for day in timeline:
-        if day["date"] == date:
-            target_day = day
-            break
-
-    if target_day is None:
-        from fastapi import HTTPException
-        raise HTTPException(status_code=404, detail=f"No data for date '{date}' in job '{job_id}'")
-
-    prev_day = get_previous_day(timeline, date)
+    target_day, prev_day = _target_and_previous_day(artifacts, job_id, date)
 
-    # Events + insights
-    all_events = detect_all_events(timeline, job_id)
-    all_links = link_events(all_events)
-    day_events = [e for e in all_events if e.date == date]
-    day_event_ids = {e.id for e in day_events}
-    day_links = [
-        cl for cl in all_links
-        if cl.cause_event_id in day_event_ids or cl.effect_event_id in day_event_ids
-    ]
-    insights_data = generate_insights(date, day_events, day_links, target_day, prev_day)
+    # Insights
+    day_events, day_links = _day_events_and_links(artifacts, date)
+    insights_data = await run_in_threadpool(
+        generate_insights, date, day_events, day_links, target_day, prev_day,
+    )
 
-    if format.lower() == "pdf":
-        pdf_bytes = generate_pdf(
+    if want_pdf:
+        # reportlab takes ~0.2 s to import; only pay it once a PDF is requested
+        from backend.services.pdf_generator import generate_pdf
+        pdf = await run_in_threadpool(
+            generate_pdf,
             job_id=job_id,
             target_date=date,
             shift=shift,
@@ -378,12 +597,8 @@ def get_job_report(
             prev_day=prev_day,
             insights_data=insights_data,
         )
-        filename = f"shift_report_{job_id}_{date}_{shift}.pdf"
-        return Response(
-            content=pdf_bytes,
-            media_type="application/pdf",
-            headers={"Content-Disposition": f'inline; filename="{filename}"'},
-        )
+        _store_pdf(artifacts, pdf_key, pdf)
+        return _pdf_response(pdf, filename)
 
     # JSON format — include shift-specific mud props
     mud_by_shift = target_day.get("mud_properties_by_shift", {})
@@ -15,6 +15,14 @@ class EventSeverity(str, Enum):
     LOW = "low"
 
 
+# Sort rank, HIGH first
+SEVERITY_RANK: dict[EventSeverity, int] = {
+    EventSeverity.HIGH: 0,
+    EventSeverity.MEDIUM: 1,
+    EventSeverity.LOW: 2,
+}
+
+
 class EventType(str, Enum):
     # Equipment (§5.1)
     SHAKER_DOWN = "shaker_down"
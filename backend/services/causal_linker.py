@@ -1,236 +1,262 @@
 """Causal linker — applies 7 rules to connect cause-effect event pairs.
 
-Rules from design doc §5.4.  Each rule scans the sorted event list for
-matching pairs within a specified time window, then creates CausalLink
-objects and populates Event.related_events.
+Rules from design doc §5.4, declared as data (`_RULES`).  Events are
+date-sorted and bucketed by type once (`_EventIndex`); a single engine then
+sweeps each rule's cause/effect buckets for pairs within its time window,
+creates CausalLink objects and populates Event.related_events.
 """
 
 from __future__ import annotations
 
-from datetime import date, timedelta
-from typing import Callable
+from datetime import date
+from typing import Callable, Iterator, NamedTuple
 
 from backend.schemas_insights import CausalLink, Event, EventType
 
 
 # ── Helpers ──────────────────────────────────────────────────────────────────
 
-def _parse_date(iso: str) -> date:
-    return date.fromisoformat(iso)
-
-
-def _events_of_type(events: list[Event], *types: EventType) -> list[Event]:
-    return [e for e in events if e.event_type in types]
-
-
-def _in_window(cause_date: str, effect_date: str, days_back: int, days_forward: int = 0) -> bool:
-    """Check if cause_date falls within [effect_date - days_back, effect_date + days_forward]."""
-    cd = _parse_date(cause_date)
-    ed = _parse_date(effect_date)
-    return (ed - timedelta(days=days_back)) <= cd <= (ed + timedelta(days=days_forward))
-
-
-def _link(cause: Event, effect: Event, rule: str, explanation: str, confidence: str) -> CausalLink:
-    """Create a CausalLink and wire up related_events on both sides."""
-    if effect.id not in cause.related_events:
-        cause.related_events.append(effect.id)
-    if cause.id not in effect.related_events:
-        effect.related_events.append(cause.id)
-    return CausalLink(
-        cause_event_id=cause.id,
-        effect_event_id=effect.id,
-        rule_name=rule,
-        explanation=explanation,
-        confidence=confidence,
-    )
+class _Bucket(NamedTuple):
+    """Events of one kind in date order, with their date ordinals alongside."""
+    events: list[Event]
+    ords: list[int]
+
+
+def _sweep(driver: _Bucket, partners: _Bucket, lo: int, hi: int) -> Iterator[tuple[Event, list[Event]]]:
+    """For each driver event dated d, yield it with the partners dated within
+    [d + lo, d + hi].  Both buckets are date-sorted, so the window edges only
+    move forward (two-pointer sweep)."""
+    p_ords, p_events, n = partners.ords, partners.events, len(partners.ords)
+    start = end = 0
+    for event, d in zip(*driver):
+        while start < n and p_ords[start] < d + lo:
+            start += 1
+        end = max(end, start)
+        while end < n and p_ords[end] <= d + hi:
+            end += 1
+        yield event, p_events[start:end]
+
+
+_CHEMICAL_TYPES = (EventType.NEW_CHEMICAL, EventType.CHEMICAL_SPIKE)
+
+
+class _EventIndex:
+    """Date-sorted events bucketed by type.  Built once per `link_events` call
+    so each rule can sweep its time window instead of pairing every cause
+    with every effect."""
+
+    def __init__(self, events: list[Event]) -> None:
+        # Stable sort: same-day events keep their incoming (severity) order
+        self.events = sorted(events, key=lambda e: e.date)
+        self.ords: list[int] = []
+        self._positions: dict[EventType, list[int]] = {}
+        # Attribute-filtered sub-indexes, shared by the rules that need them
+        rheology_up: list[int] = []
+        rheology_down: list[int] = []
+        weighting_agents: list[int] = []
+        ord_of: dict[str, int] = {}  # a day usually carries several events
+        for i, e in enumerate(self.events):
+            o = ord_of.get(e.date)
+            if o is None:
+                o = ord_of[e.date] = date.fromisoformat(e.date).toordinal()
+            self.ords.append(o)
+            etype = e.event_type
+            self._positions.setdefault(etype, []).append(i)
+            if etype == EventType.RHEOLOGY_SHIFT:
+                direction = e.values.get("direction")
+                if direction == "UP":
+                    rheology_up.append(i)
+                elif direction == "DOWN":
+                    rheology_down.append(i)
+            elif etype in _CHEMICAL_TYPES and e.values.get("category") == "Weighting Agent":
+                weighting_agents.append(i)
+
+        self.rheology_up = self._at(rheology_up)
+        self.rheology_down = self._at(rheology_down)
+        self.weighting_agents = self._at(weighting_agents)
+        self._buckets: dict[tuple[EventType, ...], _Bucket] = {}
+        # id(event) → (event, related IDs); dict keys give O(1), ordered dedup
+        self._related: dict[int, tuple[Event, dict[str, None]]] = {}
+
+    def _at(self, positions: list[int]) -> _Bucket:
+        return _Bucket([self.events[p] for p in positions], [self.ords[p] for p in positions])
+
+    def bucket(self, *types: EventType) -> _Bucket:
+        """Events of the given types in date order (built once per type set)."""
+        cached = self._buckets.get(types)
+        if cached is not None:
+            return cached
+        if len(types) == 1:
+            positions = self._positions.get(types[0], [])
+        else:
+            positions = sorted(p for t in types for p in self._positions.get(t, ()))
+        bucket = self._buckets[types] = self._at(positions)
+        return bucket
+
+    def has_any(self, *types: EventType) -> bool:
+        return any(t in self._positions for t in types)
+
+    def link(self, cause: Event, effect: Event, rule: str, explanation: str, confidence: str) -> CausalLink:
+        """Create a CausalLink and record the relation on both sides."""
+        self._relate(cause, effect.id)
+        self._relate(effect, cause.id)
+        return CausalLink(
+            cause_event_id=cause.id,
+            effect_event_id=effect.id,
+            rule_name=rule,
+            explanation=explanation,
+            confidence=confidence,
+        )
+
+    def _relate(self, event: Event, other_id: str) -> None:
+        entry = self._related.get(id(event))
+        if entry is None:
+            entry = self._related[id(event)] = (event, dict.fromkeys(event.related_events))
+        entry[1][other_id] = None
+
+    def write_related(self) -> None:
+        """Copy the recorded relations onto each Event's related_events."""
+        for event, related in self._related.values():
+            event.related_events = list(related)
 
 
 # ── Rules ────────────────────────────────────────────────────────────────────
+#
+# Every rule pairs a cause bucket with an effect bucket: a cause is linked to
+# an effect when it is dated within [effect + lo, effect + hi] days.  One
+# engine (`_apply_rule`) drives all of them.
+
+class _Rule(NamedTuple):
+    name: str
+    cause_types: tuple[EventType, ...]
+    effect_types: tuple[EventType, ...]
+    lo: int
+    hi: int
+    confidence: str
+    explain: Callable[[Event, Event], str]  # (cause, effect) → explanation
+    # Named _EventIndex sub-bucket to use instead of bucket(*types)
+    cause_bucket: str | None = None
+    effect_bucket: str | None = None
+    # Walk causes in the outer loop (decides link order); default is effects
+    cause_driven: bool = False
+
+
+_RULES: list[_Rule] = [
+    # SolidsSpike/SandIncrease (N-1..N) → ShakerDown (N).  1-day lookback.  HIGH.
+    _Rule(
+        "screen_failure_from_solids",
+        (EventType.SOLIDS_SPIKE, EventType.SAND_INCREASE), (EventType.SHAKER_DOWN,),
+        lo=-1, hi=0, confidence="HIGH",
+        explain=lambda cause, effect: (
+            f"{effect.title} likely caused by "
+            f"{'elevated solids' if cause.event_type == EventType.SOLIDS_SPIKE else 'sand increase'} "
+            f"on {cause.date}."
+        ),
+    ),
+    # CentrifugeDown (N-3..N-1) → LGSCreep (N-2..N).  3-day lookback.  HIGH.
+    _Rule(
+        "lgs_from_centrifuge_down",
+        (EventType.CENTRIFUGE_DOWN,), (EventType.LGS_CREEP,),
+        lo=-3, hi=0, confidence="HIGH",
+        explain=lambda cause, effect: (
+            f"LGS accumulation correlates with {cause.values.get('centrifuge', 'centrifuge')} "
+            f"downtime on {cause.date}."
+        ),
+    ),
+    # NewChemical (N-1..N) → RheologyShift (N).  1-day lookback.  HIGH.
+    _Rule(
+        "rheology_from_new_chemical",
+        (EventType.NEW_CHEMICAL,), (EventType.RHEOLOGY_SHIFT,),
+        lo=-1, hi=0, confidence="HIGH",
+        explain=lambda cause, effect: (
+            f"Rheology change follows introduction of "
+            f"'{cause.values.get('item_name', 'new chemical')}' on {cause.date}."
+        ),
+    ),
+    # LGSCreep (N-3..N) → RheologyShift(UP) (N).  3-day lookback.  MEDIUM.
+    _Rule(
+        "rheology_from_lgs",
+        (EventType.LGS_CREEP,), (EventType.RHEOLOGY_SHIFT,),
+        lo=-3, hi=0, confidence="MEDIUM",
+        explain=lambda cause, effect: (
+            f"Increasing PV/YP consistent with LGS buildup "
+            f"(+{cause.values.get('delta', '?')}% over 3 days)."
+        ),
+        effect_bucket="rheology_up",
+    ),
+    # WeightUp (N) + Weighting Agent addition (N) → same day.  HIGH.
+    # Barite additions are only visible here as NEW_CHEMICAL / CHEMICAL_SPIKE
+    # events whose category is 'Weighting Agent'.
+    _Rule(
+        "weight_up_operation",
+        (EventType.NEW_CHEMICAL, EventType.CHEMICAL_SPIKE), (EventType.WEIGHT_UP,),
+        lo=0, hi=0, confidence="HIGH",
+        explain=lambda cause, effect: (
+            f"Planned weight-up operation with "
+            f"{cause.values.get('item_name', 'weighting agent')}."
+        ),
+        cause_bucket="weighting_agents",
+    ),
+    # SandIncrease (N-3..N-1) → ScreenChange (N).  Strictly before, within 3 days.  MEDIUM.
+    _Rule(
+        "screen_change_preventive",
+        (EventType.SAND_INCREASE,), (EventType.SCREEN_CHANGE,),
+        lo=-3, hi=-1, confidence="MEDIUM",
+        explain=lambda cause, effect: (
+            f"Screen mesh changed in response to sand trend "
+            f"(sand increase on {cause.date})."
+        ),
+    ),
+    # Dilution (N) → RheologyShift(DOWN) (N..N+1).  1-day lookahead.  MEDIUM.
+    # Effect dated on the cause day or the day before (cause ∈ [effect, effect + 1]).
+    _Rule(
+        "dilution_effective",
+        (EventType.DILUTION,), (EventType.RHEOLOGY_SHIFT,),
+        lo=0, hi=1, confidence="MEDIUM",
+        explain=lambda cause, effect: "Dilution treatment successfully reduced rheology.",
+        effect_bucket="rheology_down",
+        cause_driven=True,
+    ),
+]
 
-def _rule_screen_failure_from_solids(events: list[Event]) -> list[CausalLink]:
-    """SolidsSpike/SandIncrease (N-1..N) → ShakerDown (N).  1-day lookback.  HIGH."""
-    links: list[CausalLink] = []
-    causes = _events_of_type(events, EventType.SOLIDS_SPIKE, EventType.SAND_INCREASE)
-    effects = _events_of_type(events, EventType.SHAKER_DOWN)
-    for effect in effects:
-        for cause in causes:
-            if _in_window(cause.date, effect.date, days_back=1):
-                cause_label = "elevated solids" if cause.event_type == EventType.SOLIDS_SPIKE else "sand increase"
-                links.append(_link(
-                    cause, effect,
-                    rule="screen_failure_from_solids",
-                    explanation=(
-                        f"{effect.title} likely caused by {cause_label} "
-                        f"on {cause.date}."
-                    ),
-                    confidence="HIGH",
-                ))
-    return links
-
-
-def _rule_lgs_from_centrifuge_down(events: list[Event]) -> list[CausalLink]:
-    """CentrifugeDown (N-3..N-1) → LGSCreep (N-2..N).  3-day lookback.  HIGH."""
-    links: list[CausalLink] = []
-    causes = _events_of_type(events, EventType.CENTRIFUGE_DOWN)
-    effects = _events_of_type(events, EventType.LGS_CREEP)
-    for effect in effects:
-        for cause in causes:
-            if _in_window(cause.date, effect.date, days_back=3):
-                links.append(_link(
-                    cause, effect,
-                    rule="lgs_from_centrifuge_down",
-                    explanation=(
-                        f"LGS accumulation correlates with {cause.values.get('centrifuge', 'centrifuge')} "
-                        f"downtime on {cause.date}."
-                    ),
-                    confidence="HIGH",
-                ))
-    return links
-
-
-def _rule_rheology_from_new_chemical(events: list[Event]) -> list[CausalLink]:
-    """NewChemical (N-1..N) → RheologyShift (N).  1-day lookback.  HIGH."""
-    links: list[CausalLink] = []
-    causes = _events_of_type(events, EventType.NEW_CHEMICAL)
-    effects = _events_of_type(events, EventType.RHEOLOGY_SHIFT)
-    for effect in effects:
-        for cause in causes:
-            if _in_window(cause.date, effect.date, days_back=1):
-                chem_name = cause.values.get("item_name", "new chemical")
-                links.append(_link(
-                    cause, effect,
-                    rule="rheology_from_new_chemical",
-                    explanation=(
-                        f"Rheology change follows introduction of '{chem_name}' "
-                        f"on {cause.date}."
-                    ),
-                    confidence="HIGH",
-                ))
-    return links
-
-
-def _rule_rheology_from_lgs(events: list[Event]) -> list[CausalLink]:
-    """LGSCreep (N-3..N) → RheologyShift(UP) (N).  3-day lookback.  MEDIUM."""
-    links: list[CausalLink] = []
-    causes = _events_of_type(events, EventType.LGS_CREEP)
-    effects = [
-        e for e in _events_of_type(events, EventType.RHEOLOGY_SHIFT)
-        if e.values.get("direction") == "UP"
-    ]
-    for effect in effects:
-        for cause in causes:
-            if _in_window(cause.date, effect.date, days_back=3):
-                links.append(_link(
-                    cause, effect,
-                    rule="rheology_from_lgs",
-                    explanation=(
-                        f"Increasing PV/YP consistent with LGS buildup "
-                        f"(+{cause.values.get('delta', '?')}% over 3 days)."
-                    ),
-                    confidence="MEDIUM",
-                ))
-    return links
-
-
-def _rule_weight_up_operation(events: list[Event]) -> list[CausalLink]:
-    """WeightUp (N) + Weighting Agent addition (N) → same day.  HIGH.
-
-    Note: we detect barite addition via NEW_CHEMICAL or CHEMICAL_SPIKE
-    where category == 'Weighting Agent', but more reliably we check the
-    timeline chemicals directly.  Since we only have events here, we look
-    for new-chemical or chemical-spike events with Weighting Agent category.
-    """
-    links: list[CausalLink] = []
-    effects = _events_of_type(events, EventType.WEIGHT_UP)
-    causes = [
-        e for e in events
-        if e.event_type in (EventType.NEW_CHEMICAL, EventType.CHEMICAL_SPIKE)
-        and e.values.get("category") == "Weighting Agent"
-    ]
-    for effect in effects:
-        for cause in causes:
-            if cause.date == effect.date:
-                links.append(_link(
-                    cause, effect,
-                    rule="weight_up_operation",
-                    explanation=(
-                        f"Planned weight-up operation with "
-                        f"{cause.values.get('item_name', 'weighting agent')}."
-                    ),
-                    confidence="HIGH",
-                ))
-    return links
-
-
-def _rule_screen_change_preventive(events: list[Event]) -> list[CausalLink]:
-    """SandIncrease (N-3..N-1) → ScreenChange (N).  3-day lookback.  MEDIUM."""
-    links: list[CausalLink] = []
-    causes = _events_of_type(events, EventType.SAND_INCREASE)
-    effects = _events_of_type(events, EventType.SCREEN_CHANGE)
-    for effect in effects:
-        for cause in causes:
-            cd = _parse_date(cause.date)
-            ed = _parse_date(effect.date)
-            # Cause must be strictly before effect, within 3 days
-            if timedelta(days=1) <= (ed - cd) <= timedelta(days=3):
-                links.append(_link(
-                    cause, effect,
-                    rule="screen_change_preventive",
-                    explanation=(
-                        f"Screen mesh changed in response to sand trend "
-                        f"(sand increase on {cause.date})."
-                    ),
-                    confidence="MEDIUM",
-                ))
-    return links
 
+def _apply_rule(rule: _Rule, index: _EventIndex) -> list[CausalLink]:
+    """Link every cause/effect pair of *rule* that falls inside its window."""
+    causes = getattr(index, rule.cause_bucket) if rule.cause_bucket else index.bucket(*rule.cause_types)
+    effects = getattr(index, rule.effect_bucket) if rule.effect_bucket else index.bucket(*rule.effect_types)
 
-def _rule_dilution_effective(events: list[Event]) -> list[CausalLink]:
-    """Dilution (N) → RheologyShift(DOWN) (N..N+1).  1-day lookahead.  MEDIUM."""
     links: list[CausalLink] = []
-    causes = _events_of_type(events, EventType.DILUTION)
-    effects = [
-        e for e in _events_of_type(events, EventType.RHEOLOGY_SHIFT)
-        if e.values.get("direction") == "DOWN"
-    ]
-    for cause in causes:
-        for effect in effects:
-            if _in_window(cause.date, effect.date, days_back=0, days_forward=1):
-                links.append(_link(
-                    cause, effect,
-                    rule="dilution_effective",
-                    explanation="Dilution treatment successfully reduced rheology.",
-                    confidence="MEDIUM",
-                ))
+    if rule.cause_driven:
+        for cause, window in _sweep(causes, effects, -rule.hi, -rule.lo):
+            for effect in window:
+                links.append(index.link(cause, effect, rule.name, rule.explain(cause, effect), rule.confidence))
+    else:
+        for effect, window in _sweep(effects, causes, rule.lo, rule.hi):
+            for cause in window:
+                links.append(index.link(cause, effect, rule.name, rule.explain(cause, effect), rule.confidence))
     return links
 
 
-# ── All rules ────────────────────────────────────────────────────────────────
-
-_ALL_RULES: list[Callable[[list[Event]], list[CausalLink]]] = [
-    _rule_screen_failure_from_solids,
-    _rule_lgs_from_centrifuge_down,
-    _rule_rheology_from_new_chemical,
-    _rule_rheology_from_lgs,
-    _rule_weight_up_operation,
-    _rule_screen_change_preventive,
-    _rule_dilution_effective,
-]
-
-
 def link_events(events: list[Event]) -> list[CausalLink]:
     """Apply all 7 causal rules.  Mutates events' related_events in-place.
 
-    Returns the full list of CausalLink objects (de-duplicated by cause+effect pair).
+    Returns the full list of CausalLink objects, de-duplicated by event pair
+    regardless of direction (A→B and B→A count once; the first rule wins).
     """
+    index = _EventIndex(events)
     all_links: list[CausalLink] = []
     seen_pairs: set[tuple[str, str]] = set()
 
-    for rule_fn in _ALL_RULES:
-        for link in rule_fn(events):
-            pair = (link.cause_event_id, link.effect_event_id)
+    for rule in _RULES:
+        # Skip outright when either side has no events of the rule's types
+        if not (index.has_any(*rule.cause_types) and index.has_any(*rule.effect_types)):
+            continue
+        for link in _apply_rule(rule, index):
+            a, b = link.cause_event_id, link.effect_event_id
+            pair = (a, b) if a <= b else (b, a)
             if pair not in seen_pairs:
                 seen_pairs.add(pair)
                 all_links.append(link)
 
+    index.write_related()
     return all_links
@@ -14,11 +14,11 @@ from functools import lru_cache
 CATEGORY_PATTERNS: list[tuple[str, re.Pattern[str]]] = [
     # ── Specific Chemical Products ──────────────────────────────────────
     ("Weighting Agent",    re.compile(
-        r"barit|hematit|calcium\s*carb|barita|peso|marble|ite\b.*ite"
+        r"barit|hematit|calcium\s*carb|peso|marble|ite\b.*?ite"
         r"|calcium[\s._-]?chlor|CaCl\b|cacl2|chloride", re.I)),
     ("Viscosifier",        re.compile(
         r"gel\b|bentonit|polymer|xanthan|PAC[\s\b]|viscosi|goma|HEC\b"
-        r"|hi[\s._-]?vis|hivis|high[\s._-]?vis|gelbenex|benex", re.I)),
+        r"|hi[\s._-]?vis|high[\s._-]?vis|benex", re.I)),
     ("Fluid Loss Control", re.compile(
         r"starch|CMC\b|filtro|almid|fluid[\s._-]?loss|resinex|resina", re.I)),
     ("Thinner",            re.compile(
@@ -44,8 +44,7 @@ CATEGORY_PATTERNS: list[tuple[str, re.Pattern[str]]] = [
 
     # ── Recovered Mud ──────────────────────────────────────────────────
     ("Recovered Mud",      re.compile(
-        r"recup|recover|recuper|reciclado|reutilizad|lodo.+recup"
-        r"|fluido[\s._-]?recup", re.I)),
+        r"recup|recover|reciclado|reutilizad", re.I)),
 
     # ── Loss — Downhole ────────────────────────────────────────────────
     ("Downhole Loss",      re.compile(
@@ -56,11 +55,11 @@ CATEGORY_PATTERNS: list[tuple[str, re.Pattern[str]]] = [
 
     # ── Loss — Surface / Operational ───────────────────────────────────
     ("Surface Loss",       re.compile(
-        r"evaporat|evaporac|surface\b|superficie|spill|derrame|dumped"
+        r"evapora[tc]|surface\b|superficie|spill|derrame|dumped"
         r"|mud[\s._-]?dump|fluid[\s._-]?dump|water[\s._-]?dump"
         r"|clean[\s._-]?pit|pit[\s._-]?clean|limpieza|lavado|disposal"
         r"|dispoz|discard|waste|cellar|celler|rig[\s._-]?use"
-        r"|filtrat?i[oó]n|filtraci[oó]n|filtracion|humectac", re.I)),
+        r"|filtrat?i[oó]n|filtraci[oó]n|humectac", re.I)),
 
     # ── Cementing ──────────────────────────────────────────────────────
     ("Cementing",          re.compile(
@@ -95,13 +94,13 @@ CATEGORY_PATTERNS: list[tuple[str, re.Pattern[str]]] = [
     # ── Whole Mud / Mud System ─────────────────────────────────────────
     ("Mud System",         re.compile(
         r"polytra[xk]|politra[xk]|traxx\b|spud[\s._-]?mud|kill[\s._-]?mud"
-        r"|\bobm\b|\bsbm\b|\bsobm\b|\bwbm\b|upright|up[\s._-]?right"
-        r"|premix|pre[\s._-]?mix|whole[\s._-]?mud|fresh[\s._-]?mud"
+        r"|\bobm\b|\bsbm\b|\bsobm\b|\bwbm\b|up[\s._-]?right"
+        r"|pre[\s._-]?mix|whole[\s._-]?mud|fresh[\s._-]?mud"
         r"|recycl.*mud|reciclat.*mud|rheliant|terraform|formadrill"
         r"|klashield|RDF\b|drill[\s._-]?in\b|drill[\s._-]?n\b|LSND\b"
         r"|PCS[\s._-]?mud|3rd[\s._-]?party|NOV\s+OBM|EOG|SLB|SOLO|Halliburton"
         r"|make[\s._-]?up[\s._-]?mud|sweep|PETROS|frac[\s._-]?mud"
-        r"|lodo\b|weighted[\s._-]?mud|contaminad|MUD\b|\bmud\b", re.I)),
+        r"|lodo\b|weighted[\s._-]?mud|contaminad|mud\b", re.I)),
 
     # ── Operational / Misc ─────────────────────────────────────────────
     ("Operational",        re.compile(
@@ -120,6 +119,8 @@ CATEGORY_PATTERNS: list[tuple[str, re.Pattern[str]]] = [
 
 DEFAULT_CATEGORY = "Generic/Unknown"
 
+_STRIP_NUMERIC_PUNCT = str.maketrans("", "", ".-")
+
 
 @lru_cache(maxsize=4096)
 def categorize(item_name: str | None) -> str:
@@ -130,7 +131,7 @@ def categorize(item_name: str | None) -> str:
     name = item_name.strip()
 
     # Skip purely numeric or single-character junk entries
-    if len(name) <= 2 or name.replace('.', '').replace('-', '').isdigit():
+    if len(name) <= 2 or name.translate(_STRIP_NUMERIC_PUNCT).isdigit():
         return DEFAULT_CATEGORY
 
     for category, pattern in CATEGORY_PATTERNS:
@@ -141,4 +142,5 @@ def categorize(item_name: str | None) -> str:
 
 def categorize_batch(item_names: list[str]) -> dict[str, str]:
     """Categorize a list of item names. Returns {item_name: category}."""
-    return {name: categorize(name) for name in item_names}
+    # Names repeat heavily; categorize each distinct one once (first-seen order)
+    return {name: categorize(name) for name in dict.fromkeys(item_names)}
@@ -6,14 +6,22 @@ Organised in three sections:
   3. Inventory event detectors   (§5.3)
 
 Each detector receives the full timeline (list[dict]) and returns list[Event].
+Detectors marked `@_columnar` instead receive a struct-of-arrays view of the
+mud properties (`MudSeries`), built once per `detect_all_events` call.
 The orchestrator `detect_all_events` calls every detector and merges results.
+
+Events are built with `Event.model_construct`, skipping Pydantic validation:
+every field is filled here from values that already have the schema's types.
 """
 
 from __future__ import annotations
 
-from typing import Any
+from functools import lru_cache
+from typing import Any, Callable, NamedTuple
+
+import numpy as np
 
-from backend.schemas_insights import Event, EventSeverity, EventType
+from backend.schemas_insights import SEVERITY_RANK, Event, EventSeverity, EventType
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -22,25 +30,107 @@ from backend.schemas_insights import Event, EventSeverity, EventType
 
 def _evt_id(job: str, date: str, etype: str, detail: str = "") -> str:
     """Generate a deterministic event ID."""
-    parts = [f"evt_{job}_{date}_{etype}"]
     if detail:
-        parts[0] += f"_{detail}"
-    return parts[0]
-
-
-def _rolling_avg(values: list[float | None], window: int) -> float | None:
-    """Compute rolling average of the last *window* non-None values."""
-    valid = [v for v in values[-window:] if v is not None]
-    if not valid:
-        return None
-    return sum(valid) / len(valid)
-
-
-def _pct_change(prev: float | None, curr: float | None) -> float | None:
-    """Percentage change from prev → curr.  Returns None if either is None or prev is 0."""
-    if prev is None or curr is None or prev == 0:
-        return None
-    return ((curr - prev) / abs(prev)) * 100
+        return f"evt_{job}_{date}_{etype}_{detail}"
+    return f"evt_{job}_{date}_{etype}"
+
+
+@lru_cache(maxsize=1024)
+def _unit_tag(name: str) -> str:
+    """Equipment name as used in event IDs ("Shaker 1" → "Shaker1")."""
+    return name.replace(" ", "")
+
+
+@lru_cache(maxsize=4096)
+def _item_tag(item: str) -> str:
+    """Chemical item name as used in event IDs: underscores, max 20 chars."""
+    return item.replace(" ", "_")[:20]
+
+
+def _pct_change(prev: np.ndarray, curr: np.ndarray) -> np.ndarray:
+    """Element-wise percentage change prev → curr.  NaN where either side is
+    missing (NaN) or prev is 0."""
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(prev != 0, ((curr - prev) / np.abs(prev)) * 100, np.nan)
+
+
+def _trailing_mean(x: np.ndarray, window: int) -> np.ndarray:
+    """Rolling average of the previous *window* readings, skipping NaN:
+    out[..., k] = mean of the non-NaN values in x[..., max(0, k - window):k].
+
+    Works along the last axis, so a 2-D input is averaged row by row.
+    Offsets are added oldest-first — the same order a plain `sum()` of the
+    window would use — so averages are exact rather than running-sum
+    approximations.  k = 0 and windows with no valid values come out NaN.
+    """
+    n = x.shape[-1]
+    padded = np.concatenate((np.full(x.shape[:-1] + (window,), np.nan), x), axis=-1)
+    total = np.zeros(x.shape)
+    count = np.zeros(x.shape)
+    for k in range(window):
+        w = padded[..., k:k + n]
+        valid = ~np.isnan(w)
+        total += np.where(valid, w, 0.0)
+        count += valid
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return total / count
+
+
+def _rolling_hits(
+    per_day: list[dict[str, Any]],
+    window: int,
+    trigger: Callable[[np.ndarray, np.ndarray], np.ndarray],
+    min_history: int = 1,
+) -> list[tuple[int, str, Any, float]]:
+    """Find entity readings that *trigger* against their own rolling average.
+
+    per_day[i] maps entity name → reading (None = missing) for timeline day i.
+    Each entity's history is the sequence of days it was reported, and the
+    average covers its previous *window* readings.  `trigger(x, avg)` gets
+    one entity's readings and trailing averages as arrays and returns a
+    boolean mask; readings with fewer than *min_history* predecessors never
+    trigger.  Returns (day index, name, reading, avg) in day / report order.
+    """
+    series: dict[str, tuple[list[int], list[int], list[Any]]] = {}
+    seq = 0
+    for i, readings in enumerate(per_day):
+        for name, value in readings.items():
+            days, order, values = series.setdefault(name, ([], [], []))
+            days.append(i)
+            order.append(seq)
+            values.append(value)
+            seq += 1
+
+    hits: list[tuple[int, int, str, Any, float]] = []
+    for name, (days, order, values) in series.items():
+        x = np.array(values, dtype=np.float64)
+        avg = _trailing_mean(x, window)
+        with np.errstate(invalid="ignore"):
+            mask = trigger(x, avg)
+        mask[:min_history] = False
+        for k in np.flatnonzero(mask):
+            hits.append((order[k], days[k], name, values[k], float(avg[k])))
+    hits.sort()
+    return [(day, name, value, avg) for _, day, name, value, avg in hits]
+
+
+@lru_cache(maxsize=64)
+def _add_loss_kind(add_loss: str | None) -> str:
+    """Lower-cased AddLoss value ("" if missing).  The column holds a handful
+    of distinct strings, so each is lowered once."""
+    return add_loss.lower() if add_loss else ""
+
+
+_ADDITION_KINDS = frozenset(("add", "mud"))
+
+
+def _min_days(n: int):
+    """Mark a detector as needing at least *n* timeline days to find anything;
+    the orchestrator skips it on shorter timelines."""
+    def mark(detector):
+        detector.min_days = n
+        return detector
+    return mark
 
 
 def _get_shaker_map(equip: dict) -> dict[str, dict]:
@@ -56,52 +146,87 @@ def _get_centrifuge_map(equip: dict) -> dict[str, dict]:
 #  1.  EQUIPMENT EVENT DETECTORS  (§5.1)
 # ═══════════════════════════════════════════════════════════════════════════════
 
-def detect_shaker_down(timeline: list[dict], job: str) -> list[Event]:
-    """ShakerHours drops >50% from 7-day rolling average → HIGH."""
-    events: list[Event] = []
-    # Collect per-shaker hours history keyed by name
-    shaker_history: dict[str, list[float | None]] = {}
-
-    for i, day in enumerate(timeline):
-        equip = day.get("equipment", {})
-        day_shakers = _get_shaker_map(equip)
-
-        for name, info in day_shakers.items():
-            hours = info.get("hours")
-            history = shaker_history.setdefault(name, [])
-
-            if i > 0 and len(history) >= 1:
-                avg = _rolling_avg(history, 7)
-                if avg is not None and avg > 0 and hours is not None and hours < avg * 0.5:
-                    drop_pct = round(((avg - hours) / avg) * 100, 1)
-                    events.append(Event(
-                        id=_evt_id(job, day["date"], "shaker_down", name.replace(" ", "")),
-                        event_type=EventType.SHAKER_DOWN,
-                        severity=EventSeverity.HIGH,
-                        date=day["date"],
-                        title=f"{name} Down",
-                        description=(
-                            f"{name} hours dropped to {hours}h, "
-                            f"{drop_pct}% below 7-day average of {round(avg, 1)}h."
-                        ),
-                        values={"shaker": name, "hours": hours, "prev_avg": round(avg, 1), "drop_pct": drop_pct},
-                    ))
-            history.append(hours)
-
-    return events
-
-
-def detect_screen_change(timeline: list[dict], job: str) -> list[Event]:
-    """ShakerSize values differ from previous day → MEDIUM."""
-    events: list[Event] = []
-    prev_shakers: dict[str, dict] = {}
+_HYDROCYCLONES = ("desander", "desilter", "mud_cleaner")
+
+_SHAKER_DOWN_TEXT = "{label} hours dropped to {hours}h, {drop_pct}% below 7-day average of {avg}h."
+_UNIT_DOWN_TEXT = "{label} hours dropped to {hours}h ({drop_pct}% below 7-day avg of {avg}h)."
+
+
+def _down_event(
+    job: str, date: str, etype: EventType, severity: EventSeverity, label: str,
+    key: str, name: str, hours: Any, avg: float, detail: str, template: str,
+) -> Event:
+    """Hours dropped >50% below the unit's 7-day average."""
+    drop_pct = round(((avg - hours) / avg) * 100, 1)
+    return Event.model_construct(
+        id=_evt_id(job, date, etype.value, detail),
+        event_type=etype,
+        severity=severity,
+        date=date,
+        title=f"{label} Down",
+        description=template.format(label=label, hours=hours, drop_pct=drop_pct, avg=round(avg, 1)),
+        values={key: name, "hours": hours, "prev_avg": round(avg, 1), "drop_pct": drop_pct},
+    )
+
+
+def _startup_event(job: str, date: str, name: str, label: str, hours: Any) -> Event:
+    """Equipment hours went 0 → >0."""
+    return Event.model_construct(
+        id=_evt_id(job, date, "equipment_startup", _unit_tag(name)),
+        event_type=EventType.EQUIPMENT_STARTUP,
+        severity=EventSeverity.LOW,
+        date=date,
+        title=f"{label} Started",
+        description=f"{label} started operating ({hours}h).",
+        values={"equipment": name, "hours": hours},
+    )
+
+
+@_min_days(2)
+def scan_equipment(timeline: list[dict], job: str) -> list[Event]:
+    """All six equipment detectors in one pass over the timeline.
+
+    Shaker / centrifuge maps are built once per day and shared:
+      - ShakerHours drops >50% from 7-day rolling average → SHAKER_DOWN (HIGH)
+      - ShakerSize values differ from previous day → SCREEN_CHANGE (MEDIUM)
+      - Centrifuge hours = 0 or drops >50% from 7-day avg → CENTRIFUGE_DOWN (HIGH)
+      - Centrifuge feed rate changes >25% → CENTRIFUGE_FEED_CHANGE (MEDIUM)
+      - Desander/desilter hours drops >50% from 7-day avg → HYDROCYCLONE_DOWN (MEDIUM)
+      - Equipment hours goes 0 → >0 → EQUIPMENT_STARTUP (LOW)
+
+    Results are returned grouped per detector, in the order above.
+    """
+    screen_changes: list[Event] = []
+    startups: list[Event] = []
+    shaker_hours: list[dict[str, Any]] = []
+    cent_hours: list[dict[str, Any]] = []
+    cent_feeds: list[dict[str, Any]] = []
+    hydro_hours: list[dict[str, Any]] = []
+    prev_shakers: dict[str, dict] | None = None
+    prev_cents: dict[str, dict] = {}
 
-    for i, day in enumerate(timeline):
+    for day in timeline:
+        date = day["date"]
         equip = day.get("equipment", {})
-        curr_shakers = _get_shaker_map(equip)
-
-        if i > 0:
-            for name, curr in curr_shakers.items():
+        shakers = _get_shaker_map(equip)
+        cents = _get_centrifuge_map(equip)
+        shaker_hours.append({name: info.get("hours") for name, info in shakers.items()})
+        cent_hours.append({name: info.get("hours") for name, info in cents.items()})
+        cent_feeds.append({name: info.get("feed_rate") for name, info in cents.items()})
+        # Fixed unit set (_HYDROCYCLONES), unrolled
+        hydro = equip.get("hydrocyclones") or {}
+        desander = hydro.get("desander")
+        desilter = hydro.get("desilter")
+        mud_cleaner = hydro.get("mud_cleaner")
+        hydro_hours.append({
+            "desander": desander.get("hours") if desander else None,
+            "desilter": desilter.get("hours") if desilter else None,
+            "mud_cleaner": mud_cleaner.get("hours") if mud_cleaner else None,
+        })
+
+        if prev_shakers is not None:
+            # Shakers: screen change, startup
+            for name, curr in shakers.items():
                 prev = prev_shakers.get(name)
                 if prev is None:
                     continue
@@ -111,386 +236,342 @@ def detect_screen_change(timeline: list[dict], job: str) -> list[Event]:
                 if (curr_mesh and prev_mesh and
                         any(c is not None and p is not None and c != p
                             for c, p in zip(curr_mesh, prev_mesh))):
-                    events.append(Event(
-                        id=_evt_id(job, day["date"], "screen_change", name.replace(" ", "")),
+                    screen_changes.append(Event.model_construct(
+                        id=_evt_id(job, date, "screen_change", _unit_tag(name)),
                         event_type=EventType.SCREEN_CHANGE,
                         severity=EventSeverity.MEDIUM,
-                        date=day["date"],
+                        date=date,
                         title=f"{name} Screen Change",
                         description=(
                             f"{name} mesh changed from {prev_mesh} to {curr_mesh}."
                         ),
                         values={"shaker": name, "prev_mesh": prev_mesh, "new_mesh": curr_mesh},
                     ))
+                if ((prev.get("hours") or 0) == 0
+                        and curr.get("hours") is not None and curr["hours"] > 0):
+                    startups.append(_startup_event(job, date, name, name, curr["hours"]))
 
-        prev_shakers = curr_shakers
-
-    return events
-
-
-def detect_centrifuge_down(timeline: list[dict], job: str) -> list[Event]:
-    """Centrifuge hours = 0 or drops >50% from 7-day avg → HIGH."""
-    events: list[Event] = []
-    cent_history: dict[str, list[float | None]] = {}
-
-    for i, day in enumerate(timeline):
-        equip = day.get("equipment", {})
-        day_cents = _get_centrifuge_map(equip)
-
-        for name, info in day_cents.items():
-            hours = info.get("hours")
-            history = cent_history.setdefault(name, [])
-
-            if i > 0 and len(history) >= 1:
-                avg = _rolling_avg(history, 7)
-                if avg is not None and avg > 0:
-                    if hours is not None and (hours == 0 or hours < avg * 0.5):
-                        drop_pct = round(((avg - hours) / avg) * 100, 1)
-                        events.append(Event(
-                            id=_evt_id(job, day["date"], "centrifuge_down", name.replace(" ", "")),
-                            event_type=EventType.CENTRIFUGE_DOWN,
-                            severity=EventSeverity.HIGH,
-                            date=day["date"],
-                            title=f"{name} Down",
-                            description=(
-                                f"{name} hours dropped to {hours}h "
-                                f"({drop_pct}% below 7-day avg of {round(avg, 1)}h)."
-                            ),
-                            values={"centrifuge": name, "hours": hours, "prev_avg": round(avg, 1), "drop_pct": drop_pct},
-                        ))
-            history.append(hours)
-
-    return events
-
-
-def detect_centrifuge_feed_change(timeline: list[dict], job: str) -> list[Event]:
-    """Centrifuge feed rate changes >25% → MEDIUM."""
-    events: list[Event] = []
-    prev_cents: dict[str, dict] = {}
-
-    for i, day in enumerate(timeline):
-        equip = day.get("equipment", {})
-        curr_cents = _get_centrifuge_map(equip)
-
-        if i > 0:
-            for name, curr in curr_cents.items():
+            # Centrifuges: startup
+            for name, curr in cents.items():
                 prev = prev_cents.get(name)
                 if prev is None:
                     continue
-                curr_feed = curr.get("feed_rate")
-                prev_feed = prev.get("feed_rate")
-                pct = _pct_change(prev_feed, curr_feed)
-                if pct is not None and abs(pct) > 25:
-                    events.append(Event(
-                        id=_evt_id(job, day["date"], "centrifuge_feed_change", name.replace(" ", "")),
-                        event_type=EventType.CENTRIFUGE_FEED_CHANGE,
-                        severity=EventSeverity.MEDIUM,
-                        date=day["date"],
-                        title=f"{name} Feed Rate Change",
-                        description=(
-                            f"{name} feed rate changed from {prev_feed} to {curr_feed} "
-                            f"({round(pct, 1):+}%)."
-                        ),
-                        values={
-                            "centrifuge": name,
-                            "prev_feed_rate": prev_feed,
-                            "new_feed_rate": curr_feed,
-                            "change_pct": round(pct, 1),
-                        },
-                    ))
-
-        prev_cents = curr_cents
-
-    return events
-
+                if ((prev.get("hours") or 0) == 0
+                        and curr.get("hours") is not None and curr["hours"] > 0):
+                    startups.append(_startup_event(job, date, name, name, curr["hours"]))
+
+            # Hydrocyclones: startup (hours already read for the rolling scan)
+            curr_hydro, prev_hydro = hydro_hours[-1], hydro_hours[-2]
+            for unit in _HYDROCYCLONES:
+                curr_h = curr_hydro[unit]
+                prev_h = prev_hydro[unit]
+                if (prev_h is not None and prev_h == 0
+                        and curr_h is not None and curr_h > 0):
+                    label = unit.replace("_", " ").title()
+                    startups.append(_startup_event(job, date, unit, label, curr_h))
+
+        prev_shakers, prev_cents = shakers, cents
+
+    # Feed-rate changes, one vectorised day-over-day scan per centrifuge
+    # (NaN on days it is missing, so those days never compare)
+    feed_series: dict[str, list[Any]] = {}
+    for i, feeds in enumerate(cent_feeds):
+        for name, feed in feeds.items():
+            feed_series.setdefault(name, [None] * len(timeline))[i] = feed
+    feed_hits: list[tuple[int, int, str, float]] = []
+    for name, values in feed_series.items():
+        x = np.array(values, dtype=np.float64)
+        pct = _pct_change(x[:-1], x[1:])
+        for j in np.flatnonzero(np.abs(pct) > 25):
+            i = j + 1
+            feed_hits.append((i, list(cent_feeds[i]).index(name), name, float(pct[j])))
+    feed_hits.sort()  # day, then the day's centrifuge order
+
+    feed_changes: list[Event] = []
+    for i, _, name, pct in feed_hits:
+        date = timeline[i]["date"]
+        prev_feed, curr_feed = cent_feeds[i - 1][name], cent_feeds[i][name]
+        feed_changes.append(Event.model_construct(
+            id=_evt_id(job, date, "centrifuge_feed_change", _unit_tag(name)),
+            event_type=EventType.CENTRIFUGE_FEED_CHANGE,
+            severity=EventSeverity.MEDIUM,
+            date=date,
+            title=f"{name} Feed Rate Change",
+            description=(
+                f"{name} feed rate changed from {prev_feed} to {curr_feed} "
+                f"({round(pct, 1):+}%)."
+            ),
+            values={
+                "centrifuge": name,
+                "prev_feed_rate": prev_feed,
+                "new_feed_rate": curr_feed,
+                "change_pct": round(pct, 1),
+            },
+        ))
+
+    # Rolling-average drops, one vectorised scan per equipment kind
+    shaker_down = [
+        _down_event(job, timeline[i]["date"], EventType.SHAKER_DOWN, EventSeverity.HIGH,
+                    name, "shaker", name, hours, avg, _unit_tag(name), _SHAKER_DOWN_TEXT)
+        for i, name, hours, avg in _rolling_hits(
+            shaker_hours, 7, lambda x, avg: (avg > 0) & (x < avg * 0.5),
+        )
+    ]
+    centrifuge_down = [
+        _down_event(job, timeline[i]["date"], EventType.CENTRIFUGE_DOWN, EventSeverity.HIGH,
+                    name, "centrifuge", name, hours, avg, _unit_tag(name), _UNIT_DOWN_TEXT)
+        for i, name, hours, avg in _rolling_hits(
+            cent_hours, 7, lambda x, avg: (avg > 0) & ((x == 0) | (x < avg * 0.5)),
+        )
+    ]
+    hydrocyclone_down = [
+        _down_event(job, timeline[i]["date"], EventType.HYDROCYCLONE_DOWN, EventSeverity.MEDIUM,
+                    unit.replace("_", " ").title(), "unit", unit, hours, avg, unit, _UNIT_DOWN_TEXT)
+        for i, unit, hours, avg in _rolling_hits(
+            hydro_hours, 7, lambda x, avg: (avg > 0) & (x < avg * 0.5),
+        )
+    ]
 
-def detect_hydrocyclone_down(timeline: list[dict], job: str) -> list[Event]:
-    """Desander/desilter hours drops >50% from 7-day avg → MEDIUM."""
-    events: list[Event] = []
-    history: dict[str, list[float | None]] = {}
+    return (shaker_down + screen_changes + centrifuge_down
+            + feed_changes + hydrocyclone_down + startups)
 
-    for i, day in enumerate(timeline):
-        hydro = day.get("equipment", {}).get("hydrocyclones", {})
-
-        for unit_name in ("desander", "desilter", "mud_cleaner"):
-            unit = hydro.get(unit_name, {})
-            hours = unit.get("hours")
-            hist = history.setdefault(unit_name, [])
-
-            if i > 0 and len(hist) >= 1:
-                avg = _rolling_avg(hist, 7)
-                if avg is not None and avg > 0 and hours is not None and hours < avg * 0.5:
-                    drop_pct = round(((avg - hours) / avg) * 100, 1)
-                    events.append(Event(
-                        id=_evt_id(job, day["date"], "hydrocyclone_down", unit_name),
-                        event_type=EventType.HYDROCYCLONE_DOWN,
-                        severity=EventSeverity.MEDIUM,
-                        date=day["date"],
-                        title=f"{unit_name.replace('_', ' ').title()} Down",
-                        description=(
-                            f"{unit_name.replace('_', ' ').title()} hours dropped to {hours}h "
-                            f"({drop_pct}% below 7-day avg of {round(avg, 1)}h)."
-                        ),
-                        values={"unit": unit_name, "hours": hours, "prev_avg": round(avg, 1), "drop_pct": drop_pct},
-                    ))
-            hist.append(hours)
 
-    return events
+# ═══════════════════════════════════════════════════════════════════════════════
+#  2.  MUD PROPERTY EVENT DETECTORS  (§5.2)
+# ═══════════════════════════════════════════════════════════════════════════════
 
+def _mp(day: dict, key: str) -> float | None:
+    """Shorthand: extract a mud property value from a timeline day."""
+    return day.get("mud_properties", {}).get(key)
 
-def detect_equipment_startup(timeline: list[dict], job: str) -> list[Event]:
-    """Equipment hours goes 0 → >0 → LOW."""
-    events: list[Event] = []
 
-    for i, day in enumerate(timeline):
-        if i == 0:
-            continue
-        prev_day = timeline[i - 1]
-        equip = day.get("equipment", {})
-        prev_equip = prev_day.get("equipment", {})
-
-        # Shakers
-        curr_shakers = _get_shaker_map(equip)
-        prev_shakers = _get_shaker_map(prev_equip)
-        for name, curr in curr_shakers.items():
-            prev = prev_shakers.get(name)
-            if (prev and (prev.get("hours") or 0) == 0
-                    and curr.get("hours") is not None and curr["hours"] > 0):
-                events.append(Event(
-                    id=_evt_id(job, day["date"], "equipment_startup", name.replace(" ", "")),
-                    event_type=EventType.EQUIPMENT_STARTUP,
-                    severity=EventSeverity.LOW,
-                    date=day["date"],
-                    title=f"{name} Started",
-                    description=f"{name} started operating ({curr['hours']}h).",
-                    values={"equipment": name, "hours": curr["hours"]},
-                ))
+class MudSeries(NamedTuple):
+    """Struct-of-arrays view of the timeline's mud properties: one float64
+    array per property, aligned with `dates`, NaN standing in for missing."""
+    dates: list[str]
+    solids: np.ndarray
+    sand: np.ndarray
+    lgs: np.ndarray
+    drill_solids: np.ndarray
+    pv: np.ndarray
+    yp: np.ndarray
+    mud_weight: np.ndarray
+    ph: np.ndarray
 
-        # Centrifuges
-        curr_cents = _get_centrifuge_map(equip)
-        prev_cents = _get_centrifuge_map(prev_equip)
-        for name, curr in curr_cents.items():
-            prev = prev_cents.get(name)
-            if (prev and (prev.get("hours") or 0) == 0
-                    and curr.get("hours") is not None and curr["hours"] > 0):
-                events.append(Event(
-                    id=_evt_id(job, day["date"], "equipment_startup", name.replace(" ", "")),
-                    event_type=EventType.EQUIPMENT_STARTUP,
-                    severity=EventSeverity.LOW,
-                    date=day["date"],
-                    title=f"{name} Started",
-                    description=f"{name} started operating ({curr['hours']}h).",
-                    values={"equipment": name, "hours": curr["hours"]},
-                ))
 
-        # Hydrocyclones
-        hydro = equip.get("hydrocyclones", {})
-        prev_hydro = prev_equip.get("hydrocyclones", {})
-        for unit_name in ("desander", "desilter", "mud_cleaner"):
-            curr_h = hydro.get(unit_name, {}).get("hours")
-            prev_h = prev_hydro.get(unit_name, {}).get("hours")
-            if (prev_h is not None and prev_h == 0
-                    and curr_h is not None and curr_h > 0):
-                label = unit_name.replace("_", " ").title()
-                events.append(Event(
-                    id=_evt_id(job, day["date"], "equipment_startup", unit_name),
-                    event_type=EventType.EQUIPMENT_STARTUP,
-                    severity=EventSeverity.LOW,
-                    date=day["date"],
-                    title=f"{label} Started",
-                    description=f"{label} started operating ({curr_h}h).",
-                    values={"equipment": unit_name, "hours": curr_h},
-                ))
+def build_mud_soa(timeline: list[dict]) -> MudSeries:
+    """Extract every mud property column in one pass over the timeline."""
+    rows = [day.get("mud_properties", {}) for day in timeline]
+    return MudSeries(
+        [day["date"] for day in timeline],
+        *(np.array([mp.get(key) for mp in rows], dtype=np.float64)
+          for key in MudSeries._fields[1:]),
+    )
 
-    return events
 
+def _columnar(detector):
+    """Mark a detector as taking the `MudSeries` view instead of the timeline."""
+    detector.columnar = True
+    return detector
 
-# ═══════════════════════════════════════════════════════════════════════════════
-#  2.  MUD PROPERTY EVENT DETECTORS  (§5.2)
-# ═══════════════════════════════════════════════════════════════════════════════
 
-def _mp(day: dict, key: str) -> float | None:
-    """Shorthand: extract a mud property value from a timeline day."""
-    return day.get("mud_properties", {}).get(key)
+def _opt(value: np.floating) -> float | None:
+    """Array element → Python float, NaN → None."""
+    return None if np.isnan(value) else float(value)
 
 
-def detect_solids_spike(timeline: list[dict], job: str) -> list[Event]:
+@_min_days(2)
+@_columnar
+def detect_solids_spike(mud: MudSeries, job: str) -> list[Event]:
     """Solids_Content increases >15% in 1 day → HIGH."""
     events: list[Event] = []
-    for i in range(1, len(timeline)):
-        prev_val = _mp(timeline[i - 1], "solids")
-        curr_val = _mp(timeline[i], "solids")
-        pct = _pct_change(prev_val, curr_val)
-        if pct is not None and pct > 15:
-            events.append(Event(
-                id=_evt_id(job, timeline[i]["date"], "solids_spike"),
-                event_type=EventType.SOLIDS_SPIKE,
-                severity=EventSeverity.HIGH,
-                date=timeline[i]["date"],
-                title="Solids Spike",
-                description=(
-                    f"Solids content increased from {prev_val}% to {curr_val}% "
-                    f"(+{round(pct, 1)}%)."
-                ),
-                values={"prev": prev_val, "curr": curr_val, "change_pct": round(pct, 1)},
-            ))
+    dates, x = mud.dates, mud.solids
+    prev, curr = x[:-1], x[1:]
+    pct = _pct_change(prev, curr)
+    for j in np.flatnonzero(pct > 15):
+        date = dates[j + 1]
+        prev_val, curr_val, change = float(prev[j]), float(curr[j]), float(pct[j])
+        events.append(Event.model_construct(
+            id=_evt_id(job, date, "solids_spike"),
+            event_type=EventType.SOLIDS_SPIKE,
+            severity=EventSeverity.HIGH,
+            date=date,
+            title="Solids Spike",
+            description=(
+                f"Solids content increased from {prev_val}% to {curr_val}% "
+                f"(+{round(change, 1)}%)."
+            ),
+            values={"prev": prev_val, "curr": curr_val, "change_pct": round(change, 1)},
+        ))
     return events
 
 
-def detect_sand_increase(timeline: list[dict], job: str) -> list[Event]:
+@_min_days(2)
+@_columnar
+def detect_sand_increase(mud: MudSeries, job: str) -> list[Event]:
     """Sand >0.5% or doubles → HIGH."""
     events: list[Event] = []
-    for i in range(1, len(timeline)):
-        prev_val = _mp(timeline[i - 1], "sand")
-        curr_val = _mp(timeline[i], "sand")
-        if curr_val is None:
-            continue
-        exceeded_abs = curr_val > 0.5
-        doubled = (prev_val is not None and prev_val > 0 and curr_val >= prev_val * 2)
-        if exceeded_abs or doubled:
-            desc_parts = []
-            if exceeded_abs:
-                desc_parts.append(f"Sand content at {curr_val}% (threshold 0.5%)")
-            if doubled:
-                desc_parts.append(f"doubled from {prev_val}%")
-            events.append(Event(
-                id=_evt_id(job, timeline[i]["date"], "sand_increase"),
-                event_type=EventType.SAND_INCREASE,
-                severity=EventSeverity.HIGH,
-                date=timeline[i]["date"],
-                title="Sand Increase",
-                description=". ".join(desc_parts) + ".",
-                values={"prev": prev_val, "curr": curr_val, "threshold": 0.5},
-            ))
+    dates, x = mud.dates, mud.sand
+    prev, curr = x[:-1], x[1:]
+    with np.errstate(invalid="ignore"):
+        exceeded_abs = curr > 0.5
+        doubled = (prev > 0) & (curr >= prev * 2)
+    for j in np.flatnonzero(exceeded_abs | doubled):
+        date = dates[j + 1]
+        prev_val, curr_val = _opt(prev[j]), float(curr[j])
+        desc_parts = []
+        if exceeded_abs[j]:
+            desc_parts.append(f"Sand content at {curr_val}% (threshold 0.5%)")
+        if doubled[j]:
+            desc_parts.append(f"doubled from {prev_val}%")
+        events.append(Event.model_construct(
+            id=_evt_id(job, date, "sand_increase"),
+            event_type=EventType.SAND_INCREASE,
+            severity=EventSeverity.HIGH,
+            date=date,
+            title="Sand Increase",
+            description=". ".join(desc_parts) + ".",
+            values={"prev": prev_val, "curr": curr_val, "threshold": 0.5},
+        ))
     return events
 
 
-def detect_lgs_creep(timeline: list[dict], job: str) -> list[Event]:
+@_min_days(4)
+@_columnar
+def detect_lgs_creep(mud: MudSeries, job: str) -> list[Event]:
     """LGS increases >0.5% over 3 days → MEDIUM."""
     events: list[Event] = []
-    for i in range(3, len(timeline)):
-        curr_val = _mp(timeline[i], "lgs")
-        base_val = _mp(timeline[i - 3], "lgs")
-        if curr_val is not None and base_val is not None:
-            delta = curr_val - base_val
-            if delta > 0.5:
-                events.append(Event(
-                    id=_evt_id(job, timeline[i]["date"], "lgs_creep"),
-                    event_type=EventType.LGS_CREEP,
-                    severity=EventSeverity.MEDIUM,
-                    date=timeline[i]["date"],
-                    title="LGS Creep",
-                    description=(
-                        f"Low-gravity solids increased by {round(delta, 2)}% over 3 days "
-                        f"({base_val}% → {curr_val}%)."
-                    ),
-                    values={"base": base_val, "curr": curr_val, "delta": round(delta, 2), "window_days": 3},
-                ))
+    dates, x = mud.dates, mud.lgs
+    base, curr = x[:-3], x[3:]
+    delta = curr - base
+    with np.errstate(invalid="ignore"):
+        hits = np.flatnonzero(delta > 0.5)
+    for j in hits:
+        date = dates[j + 3]
+        base_val, curr_val, d = float(base[j]), float(curr[j]), float(delta[j])
+        events.append(Event.model_construct(
+            id=_evt_id(job, date, "lgs_creep"),
+            event_type=EventType.LGS_CREEP,
+            severity=EventSeverity.MEDIUM,
+            date=date,
+            title="LGS Creep",
+            description=(
+                f"Low-gravity solids increased by {round(d, 2)}% over 3 days "
+                f"({base_val}% → {curr_val}%)."
+            ),
+            values={"base": base_val, "curr": curr_val, "delta": round(d, 2), "window_days": 3},
+        ))
     return events
 
 
-def detect_drill_solids_rise(timeline: list[dict], job: str) -> list[Event]:
+@_min_days(2)
+@_columnar
+def detect_drill_solids_rise(mud: MudSeries, job: str) -> list[Event]:
     """Drill solids increases >0.3% in 1 day → MEDIUM."""
     events: list[Event] = []
-    for i in range(1, len(timeline)):
-        prev_val = _mp(timeline[i - 1], "drill_solids")
-        curr_val = _mp(timeline[i], "drill_solids")
-        if prev_val is not None and curr_val is not None:
-            delta = curr_val - prev_val
-            if delta > 0.3:
-                events.append(Event(
-                    id=_evt_id(job, timeline[i]["date"], "drill_solids_rise"),
-                    event_type=EventType.DRILL_SOLIDS_RISE,
-                    severity=EventSeverity.MEDIUM,
-                    date=timeline[i]["date"],
-                    title="Drill Solids Rise",
-                    description=(
-                        f"Drill solids increased by {round(delta, 2)}% in 1 day "
-                        f"({prev_val}% → {curr_val}%)."
-                    ),
-                    values={"prev": prev_val, "curr": curr_val, "delta": round(delta, 2)},
-                ))
+    dates, x = mud.dates, mud.drill_solids
+    delta = np.diff(x)
+    with np.errstate(invalid="ignore"):
+        hits = np.flatnonzero(delta > 0.3)
+    for j in hits:
+        date = dates[j + 1]
+        prev_val, curr_val, d = float(x[j]), float(x[j + 1]), float(delta[j])
+        events.append(Event.model_construct(
+            id=_evt_id(job, date, "drill_solids_rise"),
+            event_type=EventType.DRILL_SOLIDS_RISE,
+            severity=EventSeverity.MEDIUM,
+            date=date,
+            title="Drill Solids Rise",
+            description=(
+                f"Drill solids increased by {round(d, 2)}% in 1 day "
+                f"({prev_val}% → {curr_val}%)."
+            ),
+            values={"prev": prev_val, "curr": curr_val, "delta": round(d, 2)},
+        ))
     return events
 
 
-def detect_rheology_shift(timeline: list[dict], job: str) -> list[Event]:
+@_min_days(4)
+@_columnar
+def detect_rheology_shift(mud: MudSeries, job: str) -> list[Event]:
     """PV or YP changes >20% from 3-day avg → MEDIUM.  Tracks direction."""
     events: list[Event] = []
-    pv_history: list[float | None] = []
-    yp_history: list[float | None] = []
-
-    for i, day in enumerate(timeline):
-        pv = _mp(day, "pv")
-        yp = _mp(day, "yp")
-
-        if i >= 3:
-            pv_avg = _rolling_avg(pv_history, 3)
-            yp_avg = _rolling_avg(yp_history, 3)
-
-            triggers: list[str] = []
-            direction = None
-            values: dict[str, Any] = {}
-
-            pv_pct = _pct_change(pv_avg, pv)
-            if pv_pct is not None and abs(pv_pct) > 20:
-                direction = "UP" if pv_pct > 0 else "DOWN"
-                triggers.append(f"PV {round(pv_pct, 1):+}% vs 3-day avg")
-                values["pv"] = pv
-                values["pv_avg"] = round(pv_avg, 1) if pv_avg else None
-                values["pv_change_pct"] = round(pv_pct, 1)
-
-            yp_pct = _pct_change(yp_avg, yp)
-            if yp_pct is not None and abs(yp_pct) > 20:
-                d = "UP" if yp_pct > 0 else "DOWN"
-                if direction is None:
-                    direction = d
-                triggers.append(f"YP {round(yp_pct, 1):+}% vs 3-day avg")
-                values["yp"] = yp
-                values["yp_avg"] = round(yp_avg, 1) if yp_avg else None
-                values["yp_change_pct"] = round(yp_pct, 1)
-
-            if triggers:
-                values["direction"] = direction
-                events.append(Event(
-                    id=_evt_id(job, day["date"], "rheology_shift"),
-                    event_type=EventType.RHEOLOGY_SHIFT,
-                    severity=EventSeverity.MEDIUM,
-                    date=day["date"],
-                    title=f"Rheology Shift ({direction})",
-                    description="Rheology shift detected: " + "; ".join(triggers) + ".",
-                    values=values,
-                ))
-
-        pv_history.append(pv)
-        yp_history.append(yp)
+    dates = mud.dates
+    pv, yp = mud.pv[3:], mud.yp[3:]
+    pv_avg = _trailing_mean(mud.pv, 3)[3:]
+    yp_avg = _trailing_mean(mud.yp, 3)[3:]
+    pv_pct = _pct_change(pv_avg, pv)
+    yp_pct = _pct_change(yp_avg, yp)
+    pv_hit = np.abs(pv_pct) > 20
+    yp_hit = np.abs(yp_pct) > 20
+
+    for j in np.flatnonzero(pv_hit | yp_hit):
+        date = dates[j + 3]
+        triggers: list[str] = []
+        direction = None
+        values: dict[str, Any] = {}
+
+        if pv_hit[j]:
+            pct = float(pv_pct[j])
+            direction = "UP" if pct > 0 else "DOWN"
+            triggers.append(f"PV {round(pct, 1):+}% vs 3-day avg")
+            values["pv"] = float(pv[j])
+            values["pv_avg"] = round(float(pv_avg[j]), 1)
+            values["pv_change_pct"] = round(pct, 1)
+
+        if yp_hit[j]:
+            pct = float(yp_pct[j])
+            d = "UP" if pct > 0 else "DOWN"
+            if direction is None:
+                direction = d
+            triggers.append(f"YP {round(pct, 1):+}% vs 3-day avg")
+            values["yp"] = float(yp[j])
+            values["yp_avg"] = round(float(yp_avg[j]), 1)
+            values["yp_change_pct"] = round(pct, 1)
+
+        values["direction"] = direction
+        values["dir_verb"] = "increasing" if direction == "UP" else "decreasing"  # narrative wording
+        events.append(Event.model_construct(
+            id=_evt_id(job, date, "rheology_shift"),
+            event_type=EventType.RHEOLOGY_SHIFT,
+            severity=EventSeverity.MEDIUM,
+            date=date,
+            title=f"Rheology Shift ({direction})",
+            description="Rheology shift detected: " + "; ".join(triggers) + ".",
+            values=values,
+        ))
 
     return events
 
 
-def detect_weight_up(timeline: list[dict], job: str) -> list[Event]:
+@_min_days(2)
+@_columnar
+def detect_weight_up(mud: MudSeries, job: str) -> list[Event]:
     """Mud weight increases >0.3 ppg → MEDIUM."""
     events: list[Event] = []
-    for i in range(1, len(timeline)):
-        prev_mw = _mp(timeline[i - 1], "mud_weight")
-        curr_mw = _mp(timeline[i], "mud_weight")
-        if prev_mw is not None and curr_mw is not None:
-            delta = curr_mw - prev_mw
-            if delta > 0.3:
-                events.append(Event(
-                    id=_evt_id(job, timeline[i]["date"], "weight_up"),
-                    event_type=EventType.WEIGHT_UP,
-                    severity=EventSeverity.MEDIUM,
-                    date=timeline[i]["date"],
-                    title="Weight Up",
-                    description=(
-                        f"Mud weight increased by {round(delta, 2)} ppg "
-                        f"({prev_mw} → {curr_mw} ppg)."
-                    ),
-                    values={"prev": prev_mw, "curr": curr_mw, "delta": round(delta, 2)},
-                ))
+    dates, x = mud.dates, mud.mud_weight
+    delta = np.diff(x)
+    with np.errstate(invalid="ignore"):
+        hits = np.flatnonzero(delta > 0.3)
+    for j in hits:
+        date = dates[j + 1]
+        prev_mw, curr_mw, d = float(x[j]), float(x[j + 1]), float(delta[j])
+        events.append(Event.model_construct(
+            id=_evt_id(job, date, "weight_up"),
+            event_type=EventType.WEIGHT_UP,
+            severity=EventSeverity.MEDIUM,
+            date=date,
+            title="Weight Up",
+            description=(
+                f"Mud weight increased by {round(d, 2)} ppg "
+                f"({prev_mw} → {curr_mw} ppg)."
+            ),
+            values={"prev": prev_mw, "curr": curr_mw, "delta": round(d, 2)},
+        ))
     return events
 
 
+@_min_days(2)
 def detect_dilution(timeline: list[dict], job: str) -> list[Event]:
     """Mud weight drops AND water additions detected → LOW."""
     events: list[Event] = []
@@ -507,12 +588,12 @@ def detect_dilution(timeline: list[dict], job: str) -> list[Event]:
         water_adds = [
             c for c in timeline[i].get("chemicals", [])
             if c.get("category") == "Base Fluid"
-            and c.get("add_loss", "").lower() in ("add", "mud")
+            and _add_loss_kind(c.get("add_loss")) in _ADDITION_KINDS
             and (c.get("quantity") or 0) > 0
         ]
         if water_adds:
             total_water = sum(c.get("quantity", 0) for c in water_adds)
-            events.append(Event(
+            events.append(Event.model_construct(
                 id=_evt_id(job, timeline[i]["date"], "dilution"),
                 event_type=EventType.DILUTION,
                 severity=EventSeverity.LOW,
@@ -532,28 +613,31 @@ def detect_dilution(timeline: list[dict], job: str) -> list[Event]:
     return events
 
 
-def detect_ph_shift(timeline: list[dict], job: str) -> list[Event]:
+@_min_days(2)
+@_columnar
+def detect_ph_shift(mud: MudSeries, job: str) -> list[Event]:
     """pH changes >0.5 units → MEDIUM."""
     events: list[Event] = []
-    for i in range(1, len(timeline)):
-        prev_ph = _mp(timeline[i - 1], "ph")
-        curr_ph = _mp(timeline[i], "ph")
-        if prev_ph is not None and curr_ph is not None:
-            delta = curr_ph - prev_ph
-            if abs(delta) > 0.5:
-                direction = "UP" if delta > 0 else "DOWN"
-                events.append(Event(
-                    id=_evt_id(job, timeline[i]["date"], "ph_shift"),
-                    event_type=EventType.PH_SHIFT,
-                    severity=EventSeverity.MEDIUM,
-                    date=timeline[i]["date"],
-                    title=f"pH Shift ({direction})",
-                    description=(
-                        f"pH changed by {round(delta, 2)} units "
-                        f"({prev_ph} → {curr_ph})."
-                    ),
-                    values={"prev": prev_ph, "curr": curr_ph, "delta": round(delta, 2), "direction": direction},
-                ))
+    dates, x = mud.dates, mud.ph
+    delta = np.diff(x)
+    with np.errstate(invalid="ignore"):
+        hits = np.flatnonzero(np.abs(delta) > 0.5)
+    for j in hits:
+        date = dates[j + 1]
+        prev_ph, curr_ph, d = float(x[j]), float(x[j + 1]), float(delta[j])
+        direction = "UP" if d > 0 else "DOWN"
+        events.append(Event.model_construct(
+            id=_evt_id(job, date, "ph_shift"),
+            event_type=EventType.PH_SHIFT,
+            severity=EventSeverity.MEDIUM,
+            date=date,
+            title=f"pH Shift ({direction})",
+            description=(
+                f"pH changed by {round(d, 2)} units "
+                f"({prev_ph} → {curr_ph})."
+            ),
+            values={"prev": prev_ph, "curr": curr_ph, "delta": round(d, 2), "direction": direction},
+        ))
     return events
 
 
@@ -572,8 +656,8 @@ def detect_new_chemical(timeline: list[dict], job: str) -> list[Event]:
             if not item or item in seen:
                 continue
             seen.add(item)
-            events.append(Event(
-                id=_evt_id(job, day["date"], "new_chemical", item.replace(" ", "_")[:20]),
+            events.append(Event.model_construct(
+                id=_evt_id(job, day["date"], "new_chemical", _item_tag(item)),
                 event_type=EventType.NEW_CHEMICAL,
                 severity=EventSeverity.HIGH,
                 date=day["date"],
@@ -593,50 +677,71 @@ def detect_new_chemical(timeline: list[dict], job: str) -> list[Event]:
     return events
 
 
+@_min_days(8)
 def detect_chemical_spike(timeline: list[dict], job: str) -> list[Event]:
     """Quantity for an item >3× its 7-day avg → MEDIUM."""
     events: list[Event] = []
-    # Track per-item daily totals
-    item_history: dict[str, list[float]] = {}
-
+    # Per-item daily totals, items in first-seen order
+    per_day: list[dict[str, float]] = []
+    rows: dict[str, int] = {}
+    first_day: list[int] = []
+    categories: dict[str, str | None] = {}  # categorized once, in the timeline
     for i, day in enumerate(timeline):
-        # Aggregate daily totals per item
         daily_totals: dict[str, float] = {}
         for chem in day.get("chemicals", []):
             item = chem.get("item")
             qty = chem.get("quantity") or 0
-            if item and chem.get("add_loss", "").lower() in ("add", "mud"):
+            if item and _add_loss_kind(chem.get("add_loss")) in _ADDITION_KINDS:
                 daily_totals[item] = daily_totals.get(item, 0) + qty
-
-        for item, qty in daily_totals.items():
-            hist = item_history.setdefault(item, [])
-            if len(hist) >= 7:
-                avg = _rolling_avg(hist, 7)
-                if avg is not None and avg > 0 and qty > avg * 3:
-                    events.append(Event(
-                        id=_evt_id(job, day["date"], "chemical_spike", item.replace(" ", "_")[:20]),
-                        event_type=EventType.CHEMICAL_SPIKE,
-                        severity=EventSeverity.MEDIUM,
-                        date=day["date"],
-                        title=f"Chemical Spike: {item}",
-                        description=(
-                            f"'{item}' quantity ({qty}) is {round(qty / avg, 1)}× "
-                            f"the 7-day average ({round(avg, 1)})."
-                        ),
-                        values={
-                            "item_name": item,
-                            "quantity": qty,
-                            "avg_7d": round(avg, 1),
-                            "multiple": round(qty / avg, 1),
-                        },
-                    ))
-            hist.append(qty)
-
-        # Pad items not seen today with 0
-        for item in item_history:
-            if item not in daily_totals:
-                item_history[item].append(0)
-
+                if item not in rows:
+                    rows[item] = len(rows)
+                    first_day.append(i)
+                    categories[item] = chem.get("category")
+        per_day.append(daily_totals)
+    if not rows:
+        return events
+
+    # items × days table; once an item has appeared it reads 0 on days
+    # without additions, before that NaN (no history yet)
+    n = len(timeline)
+    days = np.arange(n)
+    first = np.array(first_day)[:, None]
+    table = np.full((len(rows), n), np.nan)
+    for i, daily_totals in enumerate(per_day):
+        for item, total in daily_totals.items():
+            table[rows[item], i] = total
+    table[(days >= first) & np.isnan(table)] = 0.0
+
+    avg = _trailing_mean(table, 7)
+    with np.errstate(invalid="ignore"):
+        mask = (avg > 0) & (table > avg * 3) & (days >= first + 7)
+    names = list(rows)
+    hits = sorted(
+        (i, list(per_day[i]).index(names[r]), names[r], float(avg[r, i]))
+        for r, i in zip(*np.nonzero(mask))
+    )  # day, then the day's report order
+
+    for i, _, item, avg_7d in hits:
+        day = timeline[i]
+        qty = per_day[i][item]
+        events.append(Event.model_construct(
+            id=_evt_id(job, day["date"], "chemical_spike", _item_tag(item)),
+            event_type=EventType.CHEMICAL_SPIKE,
+            severity=EventSeverity.MEDIUM,
+            date=day["date"],
+            title=f"Chemical Spike: {item}",
+            description=(
+                f"'{item}' quantity ({qty}) is {round(qty / avg_7d, 1)}× "
+                f"the 7-day average ({round(avg_7d, 1)})."
+            ),
+            values={
+                "item_name": item,
+                "category": categories[item],
+                "quantity": qty,
+                "avg_7d": round(avg_7d, 1),
+                "multiple": round(qty / avg_7d, 1),
+            },
+        ))
     return events
 
 
@@ -646,10 +751,10 @@ def detect_large_formation_loss(timeline: list[dict], job: str) -> list[Event]:
     for day in timeline:
         for chem in day.get("chemicals", []):
             category = chem.get("category", "")
-            add_loss = (chem.get("add_loss") or "").lower()
+            add_loss = _add_loss_kind(chem.get("add_loss"))
             qty = chem.get("quantity") or 0
             if category == "Downhole Loss" and add_loss == "loss" and qty > 100:
-                events.append(Event(
+                events.append(Event.model_construct(
                     id=_evt_id(job, day["date"], "large_formation_loss"),
                     event_type=EventType.LARGE_FORMATION_LOSS,
                     severity=EventSeverity.HIGH,
@@ -667,37 +772,41 @@ def detect_large_formation_loss(timeline: list[dict], job: str) -> list[Event]:
     return events
 
 
+@_min_days(8)
 def detect_high_sc_removal(timeline: list[dict], job: str) -> list[Event]:
     """SC Removal losses exceed 7-day baseline → LOW (positive signal)."""
     events: list[Event] = []
-    sc_history: list[float] = []
-
-    for i, day in enumerate(timeline):
-        daily_sc = sum(
+    daily_sc = [
+        sum(
             (c.get("quantity") or 0)
             for c in day.get("chemicals", [])
             if c.get("category") == "SC Removal"
         )
-        if i >= 7 and daily_sc > 0:
-            avg = _rolling_avg(sc_history, 7)
-            if avg is not None and avg > 0 and daily_sc > avg * 1.5:
-                events.append(Event(
-                    id=_evt_id(job, day["date"], "high_sc_removal"),
-                    event_type=EventType.HIGH_SC_REMOVAL,
-                    severity=EventSeverity.LOW,
-                    date=day["date"],
-                    title="High SC Removal",
-                    description=(
-                        f"Solids control removal ({daily_sc}) exceeds "
-                        f"7-day avg ({round(avg, 1)}) by {round((daily_sc / avg - 1) * 100, 1)}%."
-                    ),
-                    values={
-                        "daily_removal": daily_sc,
-                        "avg_7d": round(avg, 1),
-                    },
-                ))
-        sc_history.append(daily_sc)
-
+        for day in timeline
+    ]
+    x = np.array(daily_sc, dtype=np.float64)
+    avg_7d = _trailing_mean(x, 7)
+    with np.errstate(invalid="ignore"):
+        mask = (x > 0) & (avg_7d > 0) & (x > avg_7d * 1.5)
+    mask[:7] = False
+
+    for i in np.flatnonzero(mask):
+        day, sc, avg = timeline[i], daily_sc[i], float(avg_7d[i])
+        events.append(Event.model_construct(
+            id=_evt_id(job, day["date"], "high_sc_removal"),
+            event_type=EventType.HIGH_SC_REMOVAL,
+            severity=EventSeverity.LOW,
+            date=day["date"],
+            title="High SC Removal",
+            description=(
+                f"Solids control removal ({sc}) exceeds "
+                f"7-day avg ({round(avg, 1)}) by {round((sc / avg - 1) * 100, 1)}%."
+            ),
+            values={
+                "daily_removal": sc,
+                "avg_7d": round(avg, 1),
+            },
+        ))
     return events
 
 
@@ -706,13 +815,8 @@ def detect_high_sc_removal(timeline: list[dict], job: str) -> list[Event]:
 # ═══════════════════════════════════════════════════════════════════════════════
 
 _ALL_DETECTORS = [
-    # Equipment
-    detect_shaker_down,
-    detect_screen_change,
-    detect_centrifuge_down,
-    detect_centrifuge_feed_change,
-    detect_hydrocyclone_down,
-    detect_equipment_startup,
+    # Equipment (all six §5.1 detectors, fused)
+    scan_equipment,
     # Mud properties
     detect_solids_spike,
     detect_sand_increase,
@@ -732,11 +836,14 @@ _ALL_DETECTORS = [
 
 def detect_all_events(timeline: list[dict], job: str) -> list[Event]:
     """Run all 18 detectors and return a merged, date-sorted event list."""
+    mud = build_mud_soa(timeline)
     all_events: list[Event] = []
     for detector in _ALL_DETECTORS:
-        all_events.extend(detector(timeline, job))
+        if len(timeline) < getattr(detector, "min_days", 1):
+            continue
+        source = mud if getattr(detector, "columnar", False) else timeline
+        all_events.extend(detector(source, job))
 
     # Sort by date, then severity (HIGH first)
-    severity_order = {EventSeverity.HIGH: 0, EventSeverity.MEDIUM: 1, EventSeverity.LOW: 2}
-    all_events.sort(key=lambda e: (e.date, severity_order.get(e.severity, 9)))
+    all_events.sort(key=lambda e: (e.date, SEVERITY_RANK.get(e.severity, 9)))
     return all_events
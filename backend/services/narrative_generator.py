@@ -7,9 +7,11 @@ mud properties per shift.  Recommendations are directional (not prescriptive).
 
 from __future__ import annotations
 
+from functools import lru_cache
+from string import Formatter
 from typing import Any
 
-from backend.schemas_insights import CausalLink, Event, EventSeverity, EventType
+from backend.schemas_insights import SEVERITY_RANK, CausalLink, Event, EventSeverity, EventType
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -219,19 +221,41 @@ _FALLBACK = {
 }
 
 
+# ── Precompiled templates ────────────────────────────────────────────────
+# Each template is parsed once into (literal text, field name | None)
+# segments; `_render` then only joins strings.
+
+_Segments = tuple[tuple[str, str | None], ...]
+
+
+def _compile(template: str) -> _Segments:
+    return tuple((literal, field) for literal, field, _spec, _conv in Formatter().parse(template))
+
+
+# Keyed by the EventType member itself, so lookups skip `.value`
+_COMPILED: dict[EventType, dict[str, _Segments]] = {
+    EventType(event_type): {part: _compile(text) for part, text in parts.items()}
+    for event_type, parts in _TEMPLATES.items()
+}
+_COMPILED_FALLBACK: dict[str, _Segments] = {part: _compile(text) for part, text in _FALLBACK.items()}
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 #  Shift note builder
 # ═══════════════════════════════════════════════════════════════════════════════
 
-_SHIFT_PROP_LABELS = [
-    ("mud_weight", "MW", "ppg"),
-    ("pv", "PV", "cP"),
-    ("yp", "YP", "lb"),
-    ("solids", "Solids", "%"),
-    ("sand", "Sand", "%"),
-    ("lgs", "LGS", "%"),
+_SHIFTS = ("day", "evening", "night")
+
+# (property key, label, unit suffix incl. leading space)
+_SHIFT_PROP_LABELS = (
+    ("mud_weight", "MW", " ppg"),
+    ("pv", "PV", " cP"),
+    ("yp", "YP", " lb"),
+    ("solids", "Solids", " %"),
+    ("sand", "Sand", " %"),
+    ("lgs", "LGS", " %"),
     ("ph", "pH", ""),
-]
+)
 
 
 def _build_shift_note(shift_props: dict[str, Any] | None, shift_name: str) -> str:
@@ -239,46 +263,75 @@ def _build_shift_note(shift_props: dict[str, Any] | None, shift_name: str) -> st
     if not shift_props or shift_props.get("samples_count", 0) == 0:
         return f"No samples recorded during {shift_name} shift."
 
-    parts: list[str] = []
-    for key, label, unit in _SHIFT_PROP_LABELS:
-        val = shift_props.get(key)
-        if val is not None:
-            parts.append(f"{label} {val}{' ' + unit if unit else ''}")
-    count = shift_props.get("samples_count", 0)
+    readings = tuple(shift_props.get(key) for key, _, _ in _SHIFT_PROP_LABELS)
+    return _format_shift_note(readings, shift_props.get("samples_count", 0), shift_name)
+
+
+@lru_cache(maxsize=4096)
+def _format_shift_note(readings: tuple[float | None, ...], count: int, shift_name: str) -> str:
+    """Shift note text for one set of readings (aligned with _SHIFT_PROP_LABELS).
+    Cached: dashboards re-request the same days repeatedly."""
+    parts = [
+        f"{label} {val}{unit}"
+        for (_, label, unit), val in zip(_SHIFT_PROP_LABELS, readings)
+        if val is not None
+    ]
     summary = ", ".join(parts[:5])  # limit to 5 props for brevity
     return f"{shift_name.capitalize()} shift ({count} sample{'s' if count != 1 else ''}): {summary}."
 
 
+def _shift_notes(timeline_day: dict[str, Any]) -> dict[str, str]:
+    """Shift note for each of the day / evening / night shifts."""
+    mud_by_shift = timeline_day.get("mud_properties_by_shift", {})
+    return {shift: _build_shift_note(mud_by_shift.get(shift), shift) for shift in _SHIFTS}
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 #  Main generator
 # ═══════════════════════════════════════════════════════════════════════════════
 
-def _safe_format(template: str, values: dict[str, Any]) -> str:
-    """Format template with values, gracefully handling missing keys."""
-    try:
-        return template.format(**values)
-    except (KeyError, ValueError, IndexError):
-        # If template has keys not in values, do a partial fill
-        result = template
-        for k, v in values.items():
-            result = result.replace("{" + k + "}", str(v))
-        return result
+_NORMAL_SUMMARY = (
+    "Normal operations. All equipment and mud properties "
+    "within expected parameters."
+)
+
+
+def _render(segments: _Segments, values: dict[str, Any], extra: dict[str, Any]) -> str:
+    """Fill precompiled template segments from *extra*, then *values*.
+    Fields found in neither are left in place as "{key}"."""
+    out: list[str] = []
+    for literal, field in segments:
+        out.append(literal)
+        if field is None:
+            continue
+        if field in extra:
+            out.append(str(extra[field]))
+        elif field in values:
+            out.append(str(values[field]))
+        else:
+            out.append("{" + field + "}")
+    return "".join(out)
+
+
+def _causes_by_effect(causal_links: list[CausalLink]) -> dict[str, list[CausalLink]]:
+    """Index causal links by the event they explain."""
+    index: dict[str, list[CausalLink]] = {}
+    for cl in causal_links:
+        index.setdefault(cl.effect_event_id, []).append(cl)
+    return index
 
 
 def _get_causal_text(
     event: Event,
-    causal_links: list[CausalLink],
+    causes_by_effect: dict[str, list[CausalLink]],
 ) -> str | None:
-    """Find causal explanations where this event is the effect."""
-    causes = [
-        cl for cl in causal_links
-        if cl.effect_event_id == event.id
-    ]
+    """Causal explanation for an event, if any link names it as the effect."""
+    causes = causes_by_effect.get(event.id)
     if not causes:
         return None
-    # Take the highest-confidence cause
-    causes.sort(key=lambda c: (0 if c.confidence == "HIGH" else 1))
-    return f"Likely cause: {causes[0].explanation}"
+    # Take the highest-confidence cause (first HIGH, else the first link)
+    best = next((c for c in causes if c.confidence == "HIGH"), causes[0])
+    return f"Likely cause: {best.explanation}"
 
 
 def generate_insights(
@@ -300,45 +353,43 @@ def generate_insights(
     Returns:
         Dict matching the InsightsResponse schema.
     """
+    if not events:
+        # Normal day: nothing to narrate beyond the shift notes
+        return {
+            "date": target_date,
+            "summary": _NORMAL_SUMMARY,
+            "insights": [],
+            "shift_notes": _shift_notes(timeline_day),
+            "recommendations": [],
+        }
+
     # Sort events: HIGH first, then MEDIUM, then LOW
-    _sev_order = {EventSeverity.HIGH: 0, EventSeverity.MEDIUM: 1, EventSeverity.LOW: 2}
-    day_events = sorted(events, key=lambda e: (_sev_order.get(e.severity, 9), e.date))
+    day_events = sorted(events, key=lambda e: (SEVERITY_RANK.get(e.severity, 9), e.date))
 
     insights: list[dict[str, Any]] = []
+    causes_by_effect = _causes_by_effect(causal_links)
+    high_count = 0
 
     for evt in day_events:
-        tmpl = _TEMPLATES.get(evt.event_type.value, _FALLBACK)
+        if evt.severity == EventSeverity.HIGH:
+            high_count += 1
+        event_type = evt.event_type
+        values = evt.values
+        tmpl = _COMPILED.get(event_type, _COMPILED_FALLBACK)
 
-        # Merge event.values with extra fields the template might need
-        fill = {**evt.values, "description": evt.description}
-
-        # For rheology_shift, add direction verb
-        if evt.event_type == EventType.RHEOLOGY_SHIFT:
-            direction = evt.values.get("direction", "")
-            fill["dir_verb"] = "increasing" if direction == "UP" else "decreasing"
-
-        narrative_text = _safe_format(tmpl["narrative"], fill)
-        rec_text = _safe_format(tmpl["recommendation"], fill)
-
-        causal_text = _get_causal_text(evt, causal_links)
+        # Extra fields the template might need, looked up before event.values
+        extra = {"description": evt.description}
 
         insights.append({
             "severity": evt.severity.value,
-            "title": _safe_format(tmpl["title"], fill),
-            "narrative": narrative_text,
-            "cause": causal_text,
-            "recommendation": rec_text,
-            "event_type": evt.event_type.value,
-            "values": evt.values,
+            "title": _render(tmpl["title"], values, extra),
+            "narrative": _render(tmpl["narrative"], values, extra),
+            "cause": _get_causal_text(evt, causes_by_effect),
+            "recommendation": _render(tmpl["recommendation"], values, extra),
+            "event_type": event_type.value,
+            "values": values,
         })
 
-    # ── Shift notes ──────────────────────────────────────────────────────
-    mud_by_shift = timeline_day.get("mud_properties_by_shift", {})
-    shift_notes = {}
-    for shift_key in ("day", "evening", "night"):
-        shift_props = mud_by_shift.get(shift_key)
-        shift_notes[shift_key] = _build_shift_note(shift_props, shift_key)
-
     # ── Recommendations (aggregated, de-duplicated, top 5) ───────────────
     seen_recs: set[str] = set()
     recs: list[str] = []
@@ -347,28 +398,24 @@ def generate_insights(
         if rec and rec not in seen_recs:
             seen_recs.add(rec)
             recs.append(rec)
-    recs = recs[:5]
+            if len(recs) == 5:
+                break
 
     # ── Summary ──────────────────────────────────────────────────────────
-    if not day_events:
-        summary = ("Normal operations. All equipment and mud properties "
-                   "within expected parameters.")
-    else:
-        high_count = sum(1 for e in day_events if e.severity == EventSeverity.HIGH)
-        total = len(day_events)
-        severity_text = f"{high_count} high-severity" if high_count else ""
-        summary_parts = [f"{total} event{'s' if total != 1 else ''} detected"]
-        if severity_text:
-            summary_parts.append(f"including {severity_text}")
-        # Mention the most notable event
-        top_evt = day_events[0]
-        summary_parts.append(f"— {top_evt.title}")
-        summary = " ".join(summary_parts) + "."
+    total = len(day_events)
+    severity_text = f"{high_count} high-severity" if high_count else ""
+    summary_parts = [f"{total} event{'s' if total != 1 else ''} detected"]
+    if severity_text:
+        summary_parts.append(f"including {severity_text}")
+    # Mention the most notable event
+    top_evt = day_events[0]
+    summary_parts.append(f"— {top_evt.title}")
+    summary = " ".join(summary_parts) + "."
 
     return {
         "date": target_date,
         "summary": summary,
         "insights": insights,
-        "shift_notes": shift_notes,
+        "shift_notes": _shift_notes(timeline_day),
         "recommendations": recs,
     }
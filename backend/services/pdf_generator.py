@@ -8,8 +8,11 @@ Layout follows wireframe §4.2:
 from __future__ import annotations
 
 import io
-from datetime import datetime
+import re
+from functools import lru_cache
+from time import gmtime, strftime
 from typing import Any
+from xml.sax.saxutils import escape
 
 from reportlab.lib import colors
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
@@ -50,6 +53,14 @@ _CLR_HEADER_FG = colors.white
 _CLR_ROW_ALT = colors.Color(0.95, 0.95, 0.97)    # light blue-grey
 _CLR_SECTION_BG = colors.Color(0.20, 0.30, 0.45) # section header
 
+# Equipment (status, colour) by hours bucket: off, < 8h, 8-16h, >= 16h
+_STATUS_TABLE: tuple[tuple[str, colors.Color], ...] = (
+    (_STATUS_OFF, _CLR_GREY),
+    (_STATUS_CRIT, _CLR_RED),
+    (_STATUS_WARN, _CLR_ORANGE),
+    (_STATUS_OK, _CLR_GREEN),
+)
+
 # WBM default target ranges
 _TARGETS: dict[str, tuple[str, str]] = {
     "mud_weight": ("8.5 - 9.0", "ppg"),
@@ -83,18 +94,45 @@ _PROP_LABELS: dict[str, str] = {
     "es": "Elec. Stability",
 }
 
+# Markup stripped from free-text remarks before they reach a Paragraph
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+
 # Mud property keys to display in the PDF table (ordered)
 _DISPLAY_PROPS = [
     "mud_weight", "pv", "yp", "gel_10s", "solids", "sand",
     "lgs", "hgs", "drill_solids", "ph", "filtrate",
 ]
 
+# (key, label, target range, unit) per mud-property row, resolved once
+_MUD_ROW_SPEC: tuple[tuple[str, str, str, str], ...] = tuple(
+    (key, _PROP_LABELS.get(key, key), *_TARGETS.get(key, ("\u2014", "")))
+    for key in _DISPLAY_PROPS
+)
+
+# Opening markup of a key-insight line, by severity
+_SEVERITY_PREFIX: dict[str, str] = {"high": "<b>[!!] ", "medium": "<b>[!] ", "low": "<b>[~] "}
+
+# Page geometry shared by every report
+_DOC_KWARGS: dict[str, Any] = {
+    "pagesize": letter,
+    "topMargin": 0.6 * inch,
+    "bottomMargin": 0.5 * inch,
+    "leftMargin": 0.75 * inch,
+    "rightMargin": 0.75 * inch,
+}
+
+# Inventory `add_loss` values (lower-cased) that mark a chemical addition
+_ADDITION_TOKENS = frozenset(("add", "addition", "added"))
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 #  Custom styles
 # ═══════════════════════════════════════════════════════════════════════════════
 
+@lru_cache(maxsize=1)
 def _get_styles() -> dict[str, ParagraphStyle]:
+    """Report paragraph styles.  Built once per process; reportlab only
+    reads styles, so every report shares them."""
     base = getSampleStyleSheet()
     return {
         "title": ParagraphStyle(
@@ -151,6 +189,44 @@ def _get_styles() -> dict[str, ParagraphStyle]:
     }
 
 
+# Table styles are static, so each is built once and shared by every report
+# (Table.setStyle only reads the commands).
+
+# Header row + grid + alternating rows, for all data tables (`_make_table`)
+_DATA_TABLE_STYLE = TableStyle([
+    ("BACKGROUND", (0, 0), (-1, 0), _CLR_HEADER_BG),
+    ("TEXTCOLOR", (0, 0), (-1, 0), _CLR_HEADER_FG),
+    ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+    ("FONTSIZE", (0, 0), (-1, -1), 8),
+    ("ALIGN", (0, 0), (-1, -1), "LEFT"),
+    ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+    ("GRID", (0, 0), (-1, -1), 0.4, colors.Color(0.8, 0.8, 0.8)),
+    ("TOPPADDING", (0, 0), (-1, -1), 3),
+    ("BOTTOMPADDING", (0, 0), (-1, -1), 3),
+    ("LEFTPADDING", (0, 0), (-1, -1), 4),
+    ("RIGHTPADDING", (0, 0), (-1, -1), 4),
+    # Alternating row colours: first data row plain, second shaded, …
+    ("ROWBACKGROUNDS", (0, 1), (-1, -1), [None, _CLR_ROW_ALT]),
+])
+
+# Job / date / shift block under the title
+_INFO_TABLE_STYLE = TableStyle([
+    ("FONTSIZE", (0, 0), (-1, -1), 9),  # cells default to Helvetica already
+    ("TOPPADDING", (0, 0), (-1, -1), 2),
+    ("BOTTOMPADDING", (0, 0), (-1, -1), 2),
+])
+
+# Volume accounting: label columns 0 and 2 in bold
+_VOLUME_TABLE_STYLE = TableStyle([
+    ("FONTSIZE", (0, 0), (-1, -1), 9),
+    ("FONTNAME", (0, 0), (0, -1), "Helvetica-Bold"),
+    ("FONTNAME", (2, 0), (2, -1), "Helvetica-Bold"),
+    ("TOPPADDING", (0, 0), (-1, -1), 3),
+    ("BOTTOMPADDING", (0, 0), (-1, -1), 3),
+    ("GRID", (0, 0), (-1, -1), 0.4, colors.Color(0.8, 0.8, 0.8)),
+])
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 #  Helper builders
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -169,37 +245,15 @@ def _delta_str(curr: float | None, prev: float | None) -> str:
 
 def _equip_status(hours: float | None) -> tuple[str, colors.Color]:
     """Determine equipment status label and colour."""
-    if hours is None or hours == 0:
-        return _STATUS_OFF, _CLR_GREY
-    if hours >= 16:
-        return _STATUS_OK, _CLR_GREEN
-    if hours >= 8:
-        return _STATUS_WARN, _CLR_ORANGE
-    return _STATUS_CRIT, _CLR_RED
+    if not hours:
+        return _STATUS_TABLE[0]
+    return _STATUS_TABLE[1 + (hours >= 8) + (hours >= 16)]
 
 
 def _make_table(data: list[list], col_widths: list[float] | None = None) -> Table:
     """Build a styled table with alternating rows."""
     t = Table(data, colWidths=col_widths, repeatRows=1)
-    style_cmds: list[tuple] = [
-        ("BACKGROUND", (0, 0), (-1, 0), _CLR_HEADER_BG),
-        ("TEXTCOLOR", (0, 0), (-1, 0), _CLR_HEADER_FG),
-        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-        ("FONTSIZE", (0, 0), (-1, 0), 8),
-        ("FONTSIZE", (0, 1), (-1, -1), 8),
-        ("ALIGN", (0, 0), (-1, -1), "LEFT"),
-        ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-        ("GRID", (0, 0), (-1, -1), 0.4, colors.Color(0.8, 0.8, 0.8)),
-        ("TOPPADDING", (0, 0), (-1, -1), 3),
-        ("BOTTOMPADDING", (0, 0), (-1, -1), 3),
-        ("LEFTPADDING", (0, 0), (-1, -1), 4),
-        ("RIGHTPADDING", (0, 0), (-1, -1), 4),
-    ]
-    # Alternating row colours
-    for i in range(1, len(data)):
-        if i % 2 == 0:
-            style_cmds.append(("BACKGROUND", (0, i), (-1, i), _CLR_ROW_ALT))
-    t.setStyle(TableStyle(style_cmds))
+    t.setStyle(_DATA_TABLE_STYLE)
     return t
 
 
@@ -212,6 +266,12 @@ def _fv(val: Any, decimals: int = 1) -> str:
     return str(val)
 
 
+@lru_cache(maxsize=256)
+def _mesh_str(mesh: tuple) -> str:
+    """Format shaker screen meshes as "140/140/170" (the roster rarely changes)."""
+    return "/".join(str(int(m)) for m in mesh if m is not None) or "\u2014"
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 #  Page-level builders
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -238,12 +298,7 @@ def _build_header(
         [f"Engineer: {engineer}", f"Depth: {depth}m MD", f"Activity: {activity}"],
     ]
     info_table = Table(info_data, colWidths=[2.2 * inch, 2.3 * inch, 2.5 * inch])
-    info_table.setStyle(TableStyle([
-        ("FONTSIZE", (0, 0), (-1, -1), 9),
-        ("FONTNAME", (0, 0), (-1, -1), "Helvetica"),
-        ("TOPPADDING", (0, 0), (-1, -1), 2),
-        ("BOTTOMPADDING", (0, 0), (-1, -1), 2),
-    ]))
+    info_table.setStyle(_INFO_TABLE_STYLE)
     elements.append(info_table)
     elements.append(Spacer(1, 8))
     return elements
@@ -264,8 +319,7 @@ def _build_equipment_table(
     for s in equipment.get("shakers", []):
         hours = s.get("hours")
         name = s.get("name", "Shaker")
-        mesh_vals = s.get("mesh", [])
-        mesh_str = "/".join(str(int(m)) for m in mesh_vals if m is not None) or "\u2014"
+        mesh_str = _mesh_str(tuple(s.get("mesh", ())))
         status_lbl, _ = _equip_status(hours)
         rows.append([name, _fv(hours, 0) + "h" if hours is not None else "\u2014",
                       "\u2014", mesh_str, status_lbl])
@@ -329,13 +383,9 @@ def _build_mud_props_table(
     header = ["Property", "Value", "Prev Day", "Delta", "Target Range"]
     rows = [header]
 
-    for prop_key in _DISPLAY_PROPS:
-        label = _PROP_LABELS.get(prop_key, prop_key)
+    for prop_key, label, target_str, unit in _MUD_ROW_SPEC:
         curr_val = shift_props.get(prop_key)
         prev_val = prev_props.get(prop_key)
-        target_info = _TARGETS.get(prop_key, ("\u2014", ""))
-        target_str = target_info[0]
-        unit = target_info[1]
 
         val_str = f"{_fv(curr_val)} {unit}".strip() if curr_val is not None else "\u2014"
         prev_str = f"{_fv(prev_val)} {unit}".strip() if prev_val is not None else "\u2014"
@@ -367,15 +417,14 @@ def _build_key_insights(
         for ins in insight_items[:6]:  # Limit to 6 insights on page 1
             severity = ins.get("severity", "low")
             style_key = f"insight_{severity}" if f"insight_{severity}" in styles else "body"
-            sev_icon = {"high": "!!", "medium": "!", "low": "~"}.get(severity, "")
-            title = ins.get("title", "")
-            narrative = ins.get("narrative", "")
+            title = escape(ins.get("title", ""))
+            narrative = escape(ins.get("narrative", ""))
             cause = ins.get("cause")
 
-            text = f"<b>[{sev_icon}] {title}</b>: {narrative}"
+            parts = [_SEVERITY_PREFIX.get(severity, "<b>[] "), title, "</b>: ", narrative]
             if cause:
-                text += f"<br/><i>{cause}</i>"
-            elements.append(Paragraph(text, styles[style_key]))
+                parts += ("<br/><i>", escape(cause), "</i>")
+            elements.append(Paragraph("".join(parts), styles[style_key]))
 
     elements.append(Spacer(1, 6))
     return elements
@@ -389,8 +438,11 @@ def _build_chemicals_section(
     elements: list = []
     elements.append(Paragraph("CHEMICAL INVENTORY CHANGES", styles["section"]))
 
-    additions = [c for c in chemicals if str(c.get("add_loss", "")).strip().lower() in ("add", "addition", "added")]
-    losses = [c for c in chemicals if c not in additions]
+    additions: list[dict[str, Any]] = []
+    losses: list[dict[str, Any]] = []
+    for c in chemicals:
+        is_addition = str(c.get("add_loss", "")).strip().lower() in _ADDITION_TOKENS
+        (additions if is_addition else losses).append(c)
 
     col_w = [2.0 * inch, 0.9 * inch, 0.8 * inch, 2.0 * inch]
 
@@ -447,14 +499,7 @@ def _build_volumes_section(
              "Mud Type", str(volumes.get("mud_type") or "\u2014")],
         ]
         vt = Table(vol_data, colWidths=[1.3 * inch, 1.5 * inch, 1.3 * inch, 1.5 * inch])
-        vt.setStyle(TableStyle([
-            ("FONTSIZE", (0, 0), (-1, -1), 9),
-            ("FONTNAME", (0, 0), (0, -1), "Helvetica-Bold"),
-            ("FONTNAME", (2, 0), (2, -1), "Helvetica-Bold"),
-            ("TOPPADDING", (0, 0), (-1, -1), 3),
-            ("BOTTOMPADDING", (0, 0), (-1, -1), 3),
-            ("GRID", (0, 0), (-1, -1), 0.4, colors.Color(0.8, 0.8, 0.8)),
-        ]))
+        vt.setStyle(_VOLUME_TABLE_STYLE)
         elements.append(vt)
 
     elements.append(Spacer(1, 8))
@@ -489,8 +534,7 @@ def _build_remarks(
 
     if remarks:
         # Strip any HTML tags for safety
-        import re
-        clean = re.sub(r"<[^>]+>", "", str(remarks))
+        clean = _HTML_TAG_RE.sub("", remarks if isinstance(remarks, str) else str(remarks))
         elements.append(Paragraph(clean, styles["body"]))
     else:
         elements.append(Paragraph("No remarks recorded.", styles["body"]))
@@ -501,7 +545,7 @@ def _build_remarks(
 
 def _build_footer(styles: dict) -> list:
     """Build footer with timestamp and version."""
-    now = datetime.utcnow().strftime("%b %d, %Y %H:%M UTC")
+    now = strftime("%b %d, %Y %H:%M UTC", gmtime())
     elements: list = []
     elements.append(Spacer(1, 12))
     elements.append(Paragraph(
@@ -511,6 +555,23 @@ def _build_footer(styles: dict) -> list:
     return elements
 
 
+# ═══════════════════════════════════════════════════════════════════════════════
+#  Worker warm-up
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def warm_up() -> None:
+    """Prime the cached styles and reportlab's font / markup caches.
+
+    Called once per worker at app startup (see backend.main) so the first
+    report request doesn't pay for them.
+    """
+    styles = _get_styles()
+    SimpleDocTemplate(io.BytesIO(), **_DOC_KWARGS).build([
+        Paragraph("<b>warm</b> <i>up</i>", styles["body"]),
+        _make_table([["warm"], ["up"]]),
+    ])
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 #  Main entry point
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -537,15 +598,7 @@ def generate_pdf(
         PDF content as bytes.
     """
     buf = io.BytesIO()
-    doc = SimpleDocTemplate(
-        buf,
-        pagesize=letter,
-        topMargin=0.6 * inch,
-        bottomMargin=0.5 * inch,
-        leftMargin=0.75 * inch,
-        rightMargin=0.75 * inch,
-        title=f"Shift Report - {job_id} - {target_date}",
-    )
+    doc = SimpleDocTemplate(buf, title=f"Shift Report - {job_id} - {target_date}", **_DOC_KWARGS)
 
     styles = _get_styles()
     story: list = []
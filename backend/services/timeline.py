@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
-import re
 from collections import defaultdict
 from datetime import date, datetime, time
+from functools import lru_cache
+from operator import attrgetter
 from typing import Any
 
+import numpy as np
+from sqlalchemy import Row, and_, case, func, or_, select
 from sqlalchemy.orm import Session
 
 from backend.models_wellstar import (
@@ -21,28 +24,103 @@ from backend.services.chemical_categorizer import categorize
 
 # ── Date / time parsing helpers ──────────────────────────────────────────────
 
-_DATE_PATTERNS = [
-    re.compile(r"^(\d{1,2})/(\d{1,2})/(\d{4})"),  # M/D/YYYY ...
-]
-
-
+@lru_cache(maxsize=8192)  # a job repeats each ReportDate across many rows
 def parse_report_date(raw: str | None) -> date | None:
     """Parse Wellstar ReportDate string → Python date.
 
-    Typical format: "1/15/2018 12:00:00 AM"
+    Typical format: "1/15/2018 12:00:00 AM" — the leading M/D/YYYY is split
+    out by hand (fixed layout, no regex needed).
     """
-    if not raw or not raw.strip():
+    if not raw:
+        return None
+    try:
+        month, day, rest = raw.strip().split("/", 2)
+    except ValueError:
+        return None
+    year = rest[:4]
+    if not (0 < len(month) <= 2 and 0 < len(day) <= 2 and len(year) == 4
+            and (month + day + year).isdecimal()):
+        return None
+    try:
+        return date(int(year), int(month), int(day))
+    except ValueError:
+        return None
+
+
+# Characters `str.strip()` removes from an ASCII string
+_ASCII_WHITESPACE = "".join(c for c in map(chr, range(128)) if c.isspace())
+
+# M/D/YYYY with 1-2 digit month and day, as accepted by `parse_report_date`
+_REPORT_DATE_GLOBS = tuple(
+    f"{m}/{d}/[0-9][0-9][0-9][0-9]*"
+    for m in ("[0-9]", "[0-9][0-9]")
+    for d in ("[0-9]", "[0-9][0-9]")
+)
+
+
+def report_date_iso(column):
+    """SQL counterpart of `parse_report_date`: "M/D/YYYY ..." → "YYYY-MM-DD".
+
+    SQLite's own ``date()`` does not understand the Wellstar format, so the
+    components are sliced out manually.  Non-matching values yield NULL, which
+    MIN/MAX aggregates skip.
+
+    On ASCII input this agrees with `parse_report_date` (same whitespace
+    stripping, digit counts and calendar check).  Python's ``strip()`` /
+    ``isdecimal()`` also accept Unicode whitespace and digits, which yield
+    NULL here, so a range filter built on this must keep NULL rows and let
+    the Python parser decide (see `get_timeline`).
+    """
+    raw = func.trim(column, _ASCII_WHITESPACE)
+    first = func.instr(raw, "/")
+    rest = func.substr(raw, first + 1)
+    second = func.instr(rest, "/")
+    year = func.substr(rest, second + 1, 4)
+    iso = func.printf(
+        "%04d-%02d-%02d",
+        year,
+        func.substr(raw, 1, first - 1),
+        func.substr(rest, 1, second - 1),
+    )
+    return case((
+        and_(
+            or_(*(raw.op("GLOB")(pattern) for pattern in _REPORT_DATE_GLOBS)),
+            year != "0000",
+            # The modifier makes date() normalise 2/30 → 3/2 instead of echoing
+            # it back; 13/1, 1/0 ... become NULL
+            func.date(iso, "+0 days") == iso,
+        ),
+        iso,
+    ))
+
+
+def _parse_clock(time_str: str) -> time | None:
+    """Fast path for the canonical "H:MM:SS AM" / "HH:MM:SS" layouts.
+
+    Returns None (caller falls back to strptime) for anything else, so only
+    inputs strptime would parse identically are handled here.
+    """
+    clock, _, suffix = time_str.partition(" ")
+    pieces = clock.split(":")
+    if len(pieces) != 3:
+        return None
+    h, m, s = pieces
+    if not (0 < len(h) <= 2 and len(m) == 2 and len(s) == 2
+            and (h + m + s).isascii() and (h + m + s).isdigit()):
+        return None
+    hour, minute, second = int(h), int(m), int(s)
+    if minute > 59 or second > 59:
         return None
-    for pat in _DATE_PATTERNS:
-        m = pat.match(raw.strip())
-        if m:
-            try:
-                return date(int(m.group(3)), int(m.group(1)), int(m.group(2)))
-            except ValueError:
-                continue
+    if suffix in ("AM", "PM"):
+        if not 1 <= hour <= 12:
+            return None
+        return time(hour % 12 + (12 if suffix == "PM" else 0), minute, second)
+    if not suffix and hour < 24:
+        return time(hour, minute, second)
     return None
 
 
+@lru_cache(maxsize=1024)  # sample times repeat (same few slots every shift)
 def parse_sample_time(raw: str | None) -> time | None:
     """Extract time-of-day from SampleTime OLE date string.
 
@@ -56,6 +134,10 @@ def parse_sample_time(raw: str | None) -> time | None:
     if len(parts) < 2:
         return None
     time_str = parts[1]  # e.g. "9:00:00 AM" or "14:00:00"
+    fast = _parse_clock(time_str)
+    if fast is not None:
+        return fast
+    # Anything off the canonical layout goes through the full format list
     for fmt in ("%I:%M:%S %p", "%H:%M:%S", "%I:%M %p", "%H:%M"):
         try:
             return datetime.strptime(time_str, fmt).time()
@@ -64,6 +146,21 @@ def parse_sample_time(raw: str | None) -> time | None:
     return None
 
 
+# Shift start times in minutes after midnight
+_DAY_START = 6 * 60
+_EVENING_START = 14 * 60
+_NIGHT_START = 22 * 60
+
+# Shift index (into _SHIFT_NAMES) for every minute of the day
+_SHIFT_NAMES = ("night", "day", "evening")
+_SHIFT_LUT = bytes(
+    [0] * _DAY_START
+    + [1] * (_EVENING_START - _DAY_START)
+    + [2] * (_NIGHT_START - _EVENING_START)
+    + [0] * (24 * 60 - _NIGHT_START)
+)
+
+
 def assign_shift(t: time | None) -> str:
     """Assign a shift label based on time of day.
 
@@ -73,12 +170,14 @@ def assign_shift(t: time | None) -> str:
     """
     if t is None:
         return "unknown"
-    if time(6, 0) <= t < time(14, 0):
-        return "day"
-    elif time(14, 0) <= t < time(22, 0):
-        return "evening"
-    else:
-        return "night"
+    # Boundaries fall on whole minutes, so seconds never matter
+    return _SHIFT_NAMES[_SHIFT_LUT[t.hour * 60 + t.minute]]
+
+
+@lru_cache(maxsize=1024)
+def _sample_shift(raw: str | None) -> str:
+    """Shift label for a raw SampleTime string."""
+    return assign_shift(parse_sample_time(raw))
 
 
 # ── Value parsing helpers ────────────────────────────────────────────────────
@@ -141,41 +240,88 @@ _MUD_PROP_FIELDS = [
 ]
 
 
-def _average_mud_props(samples: list[Sample]) -> dict[str, Any]:
-    """Average mud property fields across a set of samples."""
-    if not samples:
+# Sample columns gathered into the mud matrix: the property fields in
+# `_MUD_PROP_FIELDS` order, then Sand_Content (comma-decimal parsing)
+_MUD_COLUMNS = (*(attr for _, attr in _MUD_PROP_FIELDS), "Sand_Content")
+_N_MUD_PROPS = len(_MUD_PROP_FIELDS)
+
+
+def _mud_matrix(samples: list[Row]) -> tuple[np.ndarray, np.ndarray]:
+    """Parse every sample's mud columns once into a (samples × columns) float
+    matrix plus a "value present" mask (missing cells hold 0.0).
+
+    Rows must start with the `_MUD_COLUMNS` values (see `_TIMELINE_COLUMNS`).
+    """
+    parsed = [
+        [safe_float(v) for v in row[:_N_MUD_PROPS]] + [parse_sand_content(row[_N_MUD_PROPS])]
+        for row in samples
+    ]
+    shape = (len(parsed), len(_MUD_COLUMNS))
+    present = np.array([[v is not None for v in r] for r in parsed], dtype=bool).reshape(shape)
+    values = np.array([[0.0 if v is None else v for v in r] for r in parsed], dtype=np.float64).reshape(shape)
+    return values, present
+
+
+def _average_mud_props(
+    mud: tuple[np.ndarray, np.ndarray], positions: list[int],
+) -> dict[str, Any]:
+    """Average mud property fields across the samples at *positions* of the
+    `_mud_matrix` output.
+
+    Column sums accumulate row by row in sample order (and + 0.0 normalises
+    -0.0), so the averages match plain `sum(values) / len(values)`.
+    """
+    if not positions:
         return {key: None for key, _ in _MUD_PROP_FIELDS}
 
+    values, present = mud
+    sums = (values[positions].sum(axis=0) + 0.0).tolist()
+    counts = present[positions].sum(axis=0).tolist()
+
     result: dict[str, Any] = {}
-    for key, attr in _MUD_PROP_FIELDS:
-        values = [safe_float(getattr(s, attr, None)) for s in samples]
-        values = [v for v in values if v is not None]
-        result[key] = round(sum(values) / len(values), 2) if values else None
+    for j, (key, _) in enumerate(_MUD_PROP_FIELDS):
+        result[key] = round(sums[j] / counts[j], 2) if counts[j] else None
 
-    # Sand_Content handled separately (comma-decimal parsing)
-    sand_vals = [parse_sand_content(s.Sand_Content) for s in samples]
-    sand_vals = [v for v in sand_vals if v is not None]
-    result["sand"] = round(sum(sand_vals) / len(sand_vals), 3) if sand_vals else None
+    # Sand_Content averaged to 3 decimals
+    result["sand"] = round(sums[-1] / counts[-1], 3) if counts[-1] else None
 
-    result["samples_count"] = len(samples)
+    result["samples_count"] = len(positions)
     return result
 
 
 # ── Equipment extraction ─────────────────────────────────────────────────────
 
-def _extract_equipment(row: Equipment | None) -> dict[str, Any]:
+# Per-unit (default name, column getter) specs: shaker → (hours, name,
+# mesh 1-4), centrifuge → (hours, type, feed rate, name)
+_SHAKER_SPECS = tuple(
+    (f"Shaker {i}",
+     attrgetter(f"ShakerHours{i}", f"ShakerName{i}", *(f"ShakerSize{i}_{j}" for j in range(1, 5))))
+    for i in range(1, 6)
+)
+_CENTRIFUGE_SPECS = tuple(
+    (f"Centrifuge {i}",
+     attrgetter(f"Centrifuge{i}_Hours", f"Centrifuge{i}_Type", f"Centrifuge{i}_FeedRate", f"Centrifuge{i}Name"))
+    for i in range(1, 4)
+)
+# Hydrocyclone key → (hours, size, cones) getter
+_HYDROCYCLONE_SPECS = (
+    ("desander", attrgetter("DesanderHours", "Desander_Size", "Desander_Cones")),
+    ("desilter", attrgetter("DesilterHours", "Desilter_Size", "Desilter_Cones")),
+    ("mud_cleaner", attrgetter("MudCleanerHours", "MudCleaner_Size", "MudCleaner_Cones")),
+)
+
+
+def _extract_equipment(row: Row | None) -> dict[str, Any]:
     """Build equipment dict from an Equipment row."""
     if row is None:
         return {"shakers": [], "centrifuges": [], "hydrocyclones": {}}
 
     shakers = []
-    for i in range(1, 6):
-        hours = safe_float(getattr(row, f"ShakerHours{i}", None))
-        name = getattr(row, f"ShakerName{i}", None) or f"Shaker {i}"
-        mesh = [
-            safe_float(getattr(row, f"ShakerSize{i}_{j}", None))
-            for j in range(1, 5)
-        ]
+    for default_name, get_shaker in _SHAKER_SPECS:
+        raw_hours, raw_name, *raw_mesh = get_shaker(row)
+        hours = safe_float(raw_hours)
+        name = raw_name or default_name
+        mesh = [safe_float(m) for m in raw_mesh]
         # Only include shakers that have hours data or mesh data
         if hours is not None or any(m is not None for m in mesh):
             shakers.append({
@@ -185,11 +331,11 @@ def _extract_equipment(row: Equipment | None) -> dict[str, Any]:
             })
 
     centrifuges = []
-    for i in range(1, 4):
-        hours = safe_float(getattr(row, f"Centrifuge{i}_Hours", None))
-        c_type = getattr(row, f"Centrifuge{i}_Type", None)
-        feed = safe_float(getattr(row, f"Centrifuge{i}_FeedRate", None))
-        name = getattr(row, f"Centrifuge{i}Name", None) or f"Centrifuge {i}"
+    for default_name, get_centrifuge in _CENTRIFUGE_SPECS:
+        raw_hours, c_type, raw_feed, raw_name = get_centrifuge(row)
+        hours = safe_float(raw_hours)
+        feed = safe_float(raw_feed)
+        name = raw_name or default_name
         if hours is not None or c_type:
             centrifuges.append({
                 "name": name,
@@ -198,23 +344,14 @@ def _extract_equipment(row: Equipment | None) -> dict[str, Any]:
                 "type": c_type,
             })
 
-    hydrocyclones = {
-        "desander": {
-            "hours": safe_float(row.DesanderHours),
-            "size": safe_float(row.Desander_Size),
-            "cones": safe_int(row.Desander_Cones),
-        },
-        "desilter": {
-            "hours": safe_float(row.DesilterHours),
-            "size": safe_float(row.Desilter_Size),
-            "cones": safe_int(row.Desilter_Cones),
-        },
-        "mud_cleaner": {
-            "hours": safe_float(row.MudCleanerHours),
-            "size": safe_float(row.MudCleaner_Size),
-            "cones": safe_int(row.MudCleaner_Cones),
-        },
-    }
+    hydrocyclones = {}
+    for key, get_hydrocyclone in _HYDROCYCLONE_SPECS:
+        hours, size, cones = get_hydrocyclone(row)
+        hydrocyclones[key] = {
+            "hours": safe_float(hours),
+            "size": safe_float(size),
+            "cones": safe_int(cones),
+        }
 
     return {
         "shakers": shakers,
@@ -223,8 +360,67 @@ def _extract_equipment(row: Equipment | None) -> dict[str, Any]:
     }
 
 
+# ── Columns read per table ───────────────────────────────────────────────────
+#
+# `get_timeline` only reads a few attributes of each Wellstar row, so it
+# selects just those columns as plain Core rows (attribute access by name,
+# as on the models) instead of hydrating full ORM instances.
+
+_TIMELINE_COLUMNS: dict[type, tuple[str, ...]] = {
+    Equipment: (
+        "ReportDate",
+        *(f"ShakerHours{i}" for i in range(1, 6)),
+        *(f"ShakerName{i}" for i in range(1, 6)),
+        *(f"ShakerSize{i}_{j}" for i in range(1, 6) for j in range(1, 5)),
+        *(f"Centrifuge{i}{suffix}" for i in range(1, 4)
+          for suffix in ("_Hours", "_Type", "_FeedRate", "Name")),
+        "DesanderHours", "Desander_Size", "Desander_Cones",
+        "DesilterHours", "Desilter_Size", "Desilter_Cones",
+        "MudCleanerHours", "MudCleaner_Size", "MudCleaner_Cones",
+    ),
+    Sample: (*_MUD_COLUMNS, "ReportDate", "SampleTime"),  # mud columns first
+    ConcentAddLoss: ("ReportDate", "ItemName", "AddLoss", "Quantity", "RepUnits"),
+    Report: ("ReportDate", "MDDepth", "TVDDepth", "PresentActivity", "Remarks", "Engineer"),
+    CircData: ("ReportDate", "MudVol_totalcirc", "MudVol_Pits", "MudVol_InStorage", "MudVol_MudType"),
+}
+
+
 # ── Main timeline function ───────────────────────────────────────────────────
 
+def _iso_date_or_none(raw: str | None) -> date | None:
+    """Parse an optional ISO date filter; invalid values mean "no bound"."""
+    if not raw:
+        return None
+    try:
+        return date.fromisoformat(raw)
+    except ValueError:
+        return None
+
+
+def _index_by_date(
+    rows: list[Row], start: date | None, end: date | None, multi: bool = False,
+) -> dict[date, Any]:
+    """Index rows by parsed ReportDate, skipping unparseable or out-of-range dates.
+
+    Single-valued (last row wins) by default; with *multi*, each date maps to
+    the list of row positions instead.
+    """
+    index: dict[date, Any] = {}
+    for i, row in enumerate(rows):
+        d = parse_report_date(row.ReportDate)
+        if not d or (start is not None and d < start) or (end is not None and d > end):
+            continue
+        if multi:
+            bucket = index.get(d)
+            if bucket is None:
+                index[d] = [i]
+            else:
+                bucket.append(i)
+        else:
+            index[d] = row
+    return index
+
+
 def get_timeline(
     db: Session,
     job_id: str,
@@ -242,66 +438,45 @@ def get_timeline(
     Returns:
         List of daily summary dicts, sorted by date ascending.
     """
-    # ── Fetch all data for this job ──────────────────────────────────────
-    equipment_rows = db.query(Equipment).filter(Equipment.Job == job_id).all()
-    sample_rows = db.query(Sample).filter(Sample.Job == job_id).all()
-    chemical_rows = db.query(ConcentAddLoss).filter(ConcentAddLoss.Job == job_id).all()
-    report_rows = db.query(Report).filter(Report.Job == job_id).all()
-    circ_rows = db.query(CircData).filter(CircData.Job == job_id).all()
-
-    # ── Index by parsed date ─────────────────────────────────────────────
-    equip_by_date: dict[date, Equipment] = {}
-    for row in equipment_rows:
-        d = parse_report_date(row.ReportDate)
-        if d:
-            equip_by_date[d] = row  # One row per job+date
-
-    samples_by_date: dict[date, list[Sample]] = defaultdict(list)
-    for row in sample_rows:
-        d = parse_report_date(row.ReportDate)
-        if d:
-            samples_by_date[d].append(row)
-
-    chems_by_date: dict[date, list[ConcentAddLoss]] = defaultdict(list)
-    for row in chemical_rows:
-        d = parse_report_date(row.ReportDate)
-        if d:
-            chems_by_date[d].append(row)
-
-    reports_by_date: dict[date, Report] = {}
-    for row in report_rows:
-        d = parse_report_date(row.ReportDate)
-        if d:
-            reports_by_date[d] = row
+    sd = _iso_date_or_none(start_date)
+    ed = _iso_date_or_none(end_date)
+
+    def _rows(model) -> list[Row]:
+        # Date bounds are applied in SQL too, so out-of-range rows are never
+        # fetched.  Rows the SQL parser cannot read (NULL) are still fetched:
+        # the Python filter below has the final say
+        stmt = select(*(getattr(model, name) for name in _TIMELINE_COLUMNS[model]))
+        stmt = stmt.where(model.Job == job_id)
+        iso = report_date_iso(model.ReportDate)
+        bounds = []
+        if sd is not None:
+            bounds.append(iso >= sd.isoformat())
+        if ed is not None:
+            bounds.append(iso <= ed.isoformat())
+        if bounds:
+            stmt = stmt.where(or_(iso.is_(None), and_(*bounds)))
+        return db.execute(stmt).all()
 
-    circ_by_date: dict[date, CircData] = {}
-    for row in circ_rows:
-        d = parse_report_date(row.ReportDate)
-        if d:
-            circ_by_date[d] = row
-
-    # ── Collect all dates ────────────────────────────────────────────────
-    all_dates = sorted(
-        set(equip_by_date)
-        | set(samples_by_date)
-        | set(chems_by_date)
-        | set(reports_by_date)
-        | set(circ_by_date)
-    )
-
-    # ── Apply date filters ───────────────────────────────────────────────
-    if start_date:
-        try:
-            sd = date.fromisoformat(start_date)
-            all_dates = [d for d in all_dates if d >= sd]
-        except ValueError:
-            pass
-    if end_date:
-        try:
-            ed = date.fromisoformat(end_date)
-            all_dates = [d for d in all_dates if d <= ed]
-        except ValueError:
-            pass
+    # ── Fetch all data for this job ──────────────────────────────────────
+    equipment_rows = _rows(Equipment)
+    sample_rows = _rows(Sample)
+    chemical_rows = _rows(ConcentAddLoss)
+    report_rows = _rows(Report)
+    circ_rows = _rows(CircData)
+
+    # ── Index by parsed date (within the requested range) ─────────────────
+    # Samples and chemicals map to row positions; samples index the parsed
+    # mud matrix with them
+    equip_by_date = _index_by_date(equipment_rows, sd, ed)  # One row per job+date
+    mud = _mud_matrix(sample_rows)
+    samples_by_date = _index_by_date(sample_rows, sd, ed, multi=True)
+    chems_by_date = _index_by_date(chemical_rows, sd, ed, multi=True)
+    reports_by_date = _index_by_date(report_rows, sd, ed)
+    circ_by_date = _index_by_date(circ_rows, sd, ed)
+
+    all_dates = sorted({
+        *equip_by_date, *samples_by_date, *chems_by_date, *reports_by_date, *circ_by_date,
+    })
 
     # ── Build daily summaries ────────────────────────────────────────────
     timeline: list[dict[str, Any]] = []
@@ -314,21 +489,22 @@ def get_timeline(
         circ = circ_by_date.get(d)
 
         # Mud properties — overall daily average
-        mud_props = _average_mud_props(day_samples)
+        mud_props = _average_mud_props(mud, day_samples)
 
         # Mud properties — by shift
-        shift_buckets: dict[str, list[Sample]] = defaultdict(list)
-        for s in day_samples:
-            shift = assign_shift(parse_sample_time(s.SampleTime))
-            shift_buckets[shift].append(s)
+        shift_buckets: dict[str, list[int]] = defaultdict(list)
+        for i in day_samples:
+            shift = _sample_shift(sample_rows[i].SampleTime)
+            shift_buckets[shift].append(i)
         mud_by_shift = {
-            shift: _average_mud_props(shift_samples)
+            shift: _average_mud_props(mud, shift_samples)
             for shift, shift_samples in shift_buckets.items()
         }
 
         # Chemicals
         chemicals = []
-        for c in day_chems:
+        for i in day_chems:
+            c = chemical_rows[i]
             chemicals.append({
                 "item": c.ItemName,
                 "add_loss": c.AddLoss,
@@ -0,0 +1,89 @@
+"""ReportDate parsing in SQL and Python, and the date-bounded timeline fetch."""
+
+import pytest
+from sqlalchemy import create_engine, literal, select
+from sqlalchemy.orm import Session
+
+from backend.models_wellstar import ConcentAddLoss, Report, WellstarBase
+from backend.routers.insights import get_job_summary, get_new_chemicals, list_jobs
+from backend.services.timeline import get_timeline, parse_report_date, report_date_iso
+
+PADDED_DATES = {
+    "\t1/15/2018 12:00:00 AM": "2018-01-15",
+    "1/16/2018\n": "2018-01-16",
+    "\r\n 1/17/2018 12:00:00 AM \x0b": "2018-01-17",
+    " 1/18/2018 12:00:00 AM": "2018-01-18",  # NBSP: only Python strips it
+}
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    WellstarBase.metadata.create_all(engine)
+    with Session(engine) as session:
+        yield session
+
+
+@pytest.mark.parametrize("raw", [
+    *PADDED_DATES,
+    "1/2/2018", "01/02/2018 12:00:00 AM", "12/31/2018x",
+    "123/1/2018", "1/123/2018", "1x/2/2018", "1/2/201", "/1/2018",
+    "2/30/2018", "2/29/2024", "13/1/2018", "0/1/2018", "1/0/2018", "1/1/0000",
+    "", "junk",
+])
+def test_report_date_iso_matches_parse_report_date(db, raw):
+    parsed = parse_report_date(raw)
+    sql = db.scalar(select(report_date_iso(literal(raw))))
+    if raw.isascii():
+        assert sql == (parsed.isoformat() if parsed else None)
+    else:
+        assert sql is None  # left to the Python parser
+
+
+def test_date_bounds_keep_whitespace_padded_report_dates(db):
+    db.add_all(Report(Job="TK001", ReportDate=raw) for raw in PADDED_DATES)
+    db.add_all([
+        Report(Job="TK001", ReportDate="1/14/2018 12:00:00 AM"),
+        Report(Job="TK001", ReportDate=" 1/19/2018 "),
+    ])
+    db.commit()
+
+    timeline = get_timeline(db, "TK001", start_date="2018-01-15", end_date="2018-01-18")
+
+    assert [day["date"] for day in timeline] == sorted(PADDED_DATES.values())
+
+
+def test_new_chemicals_include_nbsp_padded_report_dates(db):
+    db.add_all([
+        ConcentAddLoss(Job="TK001", ItemName="BARITE", Quantity=10, ReportDate="1/14/2018"),
+        ConcentAddLoss(Job="TK001", ItemName="XANVIS", Quantity=2, ReportDate="1/16/2018"),
+        ConcentAddLoss(Job="TK001", ItemName="XANVIS", Quantity=1, ReportDate="\u00a01/15/2018"),
+        ConcentAddLoss(Job="TK001", ItemName="LIME", Quantity=5, ReportDate="1/18/2018\u00a0"),
+    ])
+    db.commit()
+
+    result = get_new_chemicals("TK001", db=db)
+
+    assert [
+        (c["item_name"], c["first_date"], c["first_quantity"]) for c in result["new_chemicals"]
+    ] == [
+        ("BARITE", "2018-01-14", 10),
+        ("XANVIS", "2018-01-15", 1),
+        ("LIME", "2018-01-18", 5),
+    ]
+
+
+def test_job_date_spans_include_nbsp_padded_report_dates(db):
+    db.add_all(
+        Report(Job="TK001", ReportDate=raw)
+        for raw in ("\u00a01/13/2018", "1/14/2018", "1/15/2018", "1/20/2018\u00a0")
+    )
+    db.commit()
+
+    summary = get_job_summary("TK001", db=db)
+    (job,) = list_jobs(min_reports=1, db=db)["jobs"]
+
+    assert (summary["first_date"], summary["last_date"], summary["total_days"]) == (
+        "2018-01-13", "2018-01-20", 4,
+    )
+    assert (job["first_date"], job["last_date"]) == ("2018-01-13", "2018-01-20")